@@ -0,0 +1,142 @@
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+BASIC_FIELDS = {
+    "type", "name", "steam_appid", "required_age", "is_free", "controller_support",
+    "detailed_description", "about_the_game", "short_description", "supported_languages",
+    "header_image", "capsule_image", "website", "pc_requirements", "mac_requirements",
+    "linux_requirements", "legal_notice"
+}
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+class MockStore:
+    def __init__(self, catalog_size=2000, latency_ms=80, jitter_ms=40, rate_429=0.0, seed=1):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_429 = rate_429
+        
+        self.requests = {}
+        self.throttled = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        
+        search = load_fixture("storesearch.json")["items"]
+        self.details = load_fixture("appdetails.json")
+        self.templates = list(self.details)
+        self.catalog = list(search)
+        for i in range(max(0, catalog_size - len(search))):
+            template = search[i % len(search)]
+            self.catalog.append(dict(template, id=100000 + i, name=f"{template['name']} Vol. {i // len(search) + 2}"))
+        self.by_id = {item["id"]: item for item in self.catalog}
+    
+    def counts(self):
+        with self._lock:
+            return dict(self.requests, throttled=self.throttled)
+    
+    def delay(self):
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            throttle = self._random.random() < self.rate_429
+        time.sleep(max(0.0, self.latency_ms + jitter) / 1000)
+        return throttle
+    
+    def handle(self, path, query):
+        endpoint = path.rsplit("/", 1)[-1]
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        
+        if self.delay():
+            with self._lock:
+                self.throttled += 1
+            return 429, None
+        
+        if endpoint == "storesearch":
+            return 200, self.store_search(query)
+        if endpoint == "appdetails":
+            return 200, self.app_details(query)
+        return 404, None
+    
+    def store_search(self, query):
+        term = query.get("term", "").strip().lower()
+        page = int(query.get("page", 1))
+        count = int(query.get("count", 50))
+        matches = [item for item in self.catalog if term in item["name"].lower()] if term else self.catalog
+        start = (page - 1) * count
+        return {"total": len(matches), "items": matches[start:start + count]}
+    
+    def app_details(self, query):
+        filters = set(filter(None, query.get("filters", "").split(",")))
+        if "basic" in filters:
+            filters |= BASIC_FIELDS
+        
+        results = {}
+        for value in query.get("appids", "").split(","):
+            try:
+                app_id = int(value)
+            except ValueError:
+                continue
+            item = self.by_id.get(app_id)
+            if item is None:
+                results[value] = {"success": False}
+                continue
+            
+            data = self.details.get(str(app_id))
+            if data is None:
+                data = dict(self.details[self.templates[app_id % len(self.templates)]], steam_appid=app_id, name=item["name"])
+            if filters:
+                data = {key: data[key] for key in data if key in filters}
+                if not data:
+                    data = []
+            results[value] = {"success": True, "data": data}
+        return results
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        status, data = self.server.store.handle(url.path, query)
+        body = json.dumps(data).encode("utf-8") if data is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+class MockServer:
+    def __init__(self, store, host="127.0.0.1", port=0):
+        self.store = store
+        self._server = _Server((host, port), _Handler)
+        self._server.store = store
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+    
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
\ No newline at end of file
@@ -0,0 +1,138 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from bench.mock_server import MockServer, MockStore
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SUMMARY_KEYS = {"runs", "p50_ms", "p95_ms", "p99_ms", "requests"}
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = max(0, -(-pct * len(ordered) // 100) - 1)
+    return ordered[min(index, len(ordered) - 1)]
+
+def summarize(samples, requests, extras, runs):
+    return {
+        "runs": runs,
+        "p50_ms": round(percentile(samples, 50), 1),
+        "p95_ms": round(percentile(samples, 95), 1),
+        "p99_ms": round(percentile(samples, 99), 1),
+        "requests": {name: round(count / runs, 1) for name, count in sorted(requests.items())},
+        **{name: value for name, value in sorted(extras.items())}
+    }
+
+def run_scenario(fn, harness, runs, warmup):
+    samples = []
+    requests = {}
+    extras = {}
+    for i in range(warmup + runs):
+        before = harness.store.counts()
+        elapsed, extra = fn(harness)
+        if i < warmup:
+            continue
+        samples.append(elapsed)
+        for name, count in harness.store.counts().items():
+            requests[name] = requests.get(name, 0) + count - before.get(name, 0)
+        for name, value in extra.items():
+            extras[name] = extras.get(name, 0) + value
+    return summarize(samples, requests, extras, runs)
+
+def compare(results, baseline, tolerance, slack_ms):
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for key in ("p50_ms", "p95_ms"):
+            limit = expected[key] * (1 + tolerance) + slack_ms
+            if result[key] > limit:
+                regressions.append(f"{name}: {key} {result[key]} > {limit:.1f} (baseline {expected[key]})")
+        sent = sum(count for key, count in result["requests"].items() if key != "throttled")
+        allowed = sum(count for key, count in expected.get("requests", {}).items() if key != "throttled") * (1 + tolerance)
+        if expected.get("requests") and sent > allowed:
+            regressions.append(f"{name}: {sent:.1f} requests/run > {allowed:.1f}")
+    return regressions
+
+def print_table(results, out=sys.stdout):
+    out.write(f"{'scenario':<18}{'runs':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}  requests/run\n")
+    for name, result in results.items():
+        requests = ", ".join(f"{key}={value}" for key, value in result["requests"].items() if value)
+        extras = "".join(f"  {key}={value}" for key, value in result.items() if key not in SUMMARY_KEYS)
+        out.write(f"{name:<18}{result['runs']:>6}{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}"
+                  f"{result['p99_ms']:>10.1f}  {requests or '-'}{extras}\n")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m bench", description="Crymson benchmarks against a local store stand-in")
+    parser.add_argument("scenarios", nargs="*", help="scenarios to run (default: all)")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    parser.add_argument("--jitter-ms", type=float, default=40)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="fraction of requests answered with HTTP 429")
+    parser.add_argument("--catalog-size", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--steam-rate-limits", action="store_true",
+                        help="keep the client's production rate limits instead of disabling them")
+    parser.add_argument("--tk", action="store_true", help="use the real Tk (e.g. under Xvfb) instead of the stub")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--slack-ms", type=float, default=25.0, help="allowed absolute regression")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    
+    home = tempfile.mkdtemp(prefix="crymson-bench-")
+    os.environ["HOME"] = os.environ["USERPROFILE"] = home
+    
+    store = MockStore(args.catalog_size, args.latency_ms, args.jitter_ms, args.rate_429, args.seed)
+    server = MockServer(store).start()
+    os.environ["CRYMSON_STORE_URL"] = server.url
+    
+    stub = None
+    if not args.tk:
+        from bench import tkstub
+        tkstub.install()
+        stub = tkstub
+    
+    from bench import scenarios
+    if not args.steam_rate_limits:
+        scenarios.disable_rate_limits()
+    
+    names = args.scenarios or list(scenarios.SCENARIOS)
+    unknown = [name for name in names if name not in scenarios.SCENARIOS]
+    if unknown:
+        sys.stderr.write(f"unknown scenarios: {', '.join(unknown)}\n")
+        return 2
+    
+    harness = scenarios.Harness(store, server.url, stub=stub)
+    results = {}
+    try:
+        for name in names:
+            results[name] = run_scenario(scenarios.SCENARIOS[name], harness, args.runs, args.warmup)
+    finally:
+        server.stop()
+    
+    print_table(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        regressions = compare(results, json.load(f), args.tolerance, args.slack_ms)
+    for regression in regressions:
+        sys.stdout.write(f"REGRESSION {regression}\n")
+    return 1 if regressions else 0
\ No newline at end of file
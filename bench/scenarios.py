@@ -0,0 +1,202 @@
+import os
+import shutil
+import tempfile
+import time
+
+import steam_api
+import steam_cli
+import steam_lookup
+import steam_popup
+from steam_api import SteamClient
+from steam_cache import CACHE_DIR
+from steam_core import SteamService
+from steam_watchlist import PriceTracker, Watchlist
+
+SCENARIOS = {}
+
+def scenario(name):
+    def register(fn):
+        SCENARIOS[name] = fn
+        return fn
+    return register
+
+class Harness:
+    def __init__(self, store, url, backoff_base=0.05, timeout=15.0, stub=None):
+        self.store = store
+        self.url = url
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+        self.stub = stub
+    
+    def clear_cache(self):
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    
+    def launch(self):
+        lookup = steam_lookup.SteamLookup()
+        lookup.client.backoff_base = self.backoff_base
+        return lookup
+    
+    def close(self, lookup):
+        lookup.app.after(0, lookup.app.quit)
+        lookup.run()
+        lookup.app.destroy()
+        if self.stub is not None:
+            self.stub.reset()
+    
+    def pump(self, lookup, until):
+        start = time.perf_counter()
+        while not until():
+            if time.perf_counter() - start > self.timeout:
+                raise TimeoutError("scenario did not settle")
+            lookup.app.update()
+            time.sleep(0.001)
+        return (time.perf_counter() - start) * 1000
+    
+    def idle(self, lookup, seconds):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            lookup.app.update()
+            time.sleep(0.001)
+    
+    def first_results(self, lookup):
+        return self.pump(lookup, lambda: bool(lookup.current_games))
+
+def disable_rate_limits():
+    steam_api.RATE_LIMITS.clear()
+    steam_api.DEFAULT_RATE_LIMIT = (10000.0, 10000)
+
+@scenario("startup")
+def startup(harness):
+    harness.clear_cache()
+    start = time.perf_counter()
+    lookup = harness.launch()
+    try:
+        harness.first_results(lookup)
+        return (time.perf_counter() - start) * 1000, {}
+    finally:
+        harness.close(lookup)
+
+@scenario("startup_warm")
+def startup_warm(harness):
+    if not os.path.exists(CACHE_DIR):
+        lookup = harness.launch()
+        harness.first_results(lookup)
+        harness.close(lookup)
+    
+    start = time.perf_counter()
+    lookup = harness.launch()
+    try:
+        harness.first_results(lookup)
+        return (time.perf_counter() - start) * 1000, {}
+    finally:
+        harness.close(lookup)
+
+@scenario("page_flip")
+def page_flip(harness):
+    harness.clear_cache()
+    lookup = harness.launch()
+    try:
+        harness.first_results(lookup)
+        first = lookup.current_games[0].id
+        harness.idle(lookup, 0.2)
+        lookup.next_page()
+        return harness.pump(lookup, lambda: lookup.current_games and lookup.current_games[0].id != first), {}
+    finally:
+        harness.close(lookup)
+
+@scenario("selection_burst")
+def selection_burst(harness, clicks=8, gap=0.04):
+    harness.clear_cache()
+    lookup = harness.launch()
+    try:
+        harness.first_results(lookup)
+        games = lookup.current_games[:clicks]
+        start = time.perf_counter()
+        for game in games:
+            lookup.show_game_details(game)
+            harness.idle(lookup, gap)
+        harness.pump(lookup, lambda: lookup.scheduler.in_flight == 0 and lookup.current_detail is not None)
+        elapsed = (time.perf_counter() - start) * 1000
+        shown = lookup.current_detail[0].id == games[-1].id
+        return elapsed, {"stale_final": 0 if shown else 1}
+    finally:
+        harness.close(lookup)
+
+@scenario("popup_open")
+def popup_open(harness):
+    harness.clear_cache()
+    popups = []
+    
+    class RecordingPopup(steam_popup.GameInfoPopup):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            popups.append(self)
+    
+    original = steam_popup.GameInfoPopup
+    steam_popup.GameInfoPopup = RecordingPopup
+    lookup = harness.launch()
+    try:
+        harness.first_results(lookup)
+        lookup.show_game_popup(lookup.current_games[-1])
+        return harness.pump(lookup, lambda: popups and not popups[0].pending_builders), {}
+    finally:
+        steam_popup.GameInfoPopup = original
+        harness.close(lookup)
+
+@scenario("popup_reopen")
+def popup_reopen(harness):
+    harness.clear_cache()
+    lookup = harness.launch()
+    try:
+        harness.first_results(lookup)
+        games = lookup.current_games[:2]
+        for count, game in enumerate(games, 1):
+            lookup.show_game_popup(game)
+            harness.pump(lookup, lambda: lookup.popups is not None and lookup.popups.built == count)
+        for popup in list(lookup.popups._open.values()):
+            popup.close()
+        
+        before = harness.store.counts().get("appdetails", 0)
+        start = time.perf_counter()
+        for game in games * 2:
+            lookup.show_game_popup(game)
+        elapsed = (time.perf_counter() - start) * 1000
+        return elapsed, {
+            "rebuilt": lookup.popups.built - len(games),
+            "refetched": harness.store.counts().get("appdetails", 0) - before
+        }
+    finally:
+        harness.close(lookup)
+
+@scenario("cli_bulk")
+def cli_bulk(harness, count=100):
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    with os.fdopen(fd, "w") as f:
+        f.write("\n".join(str(item["id"]) for item in harness.store.catalog[:count]))
+    
+    args = steam_cli.build_parser().parse_args(["--no-cache", "--workers", "8", "details", path])
+    service = SteamService(SteamClient(harness.url, backoff_base=harness.backoff_base), cache_path=":memory:")
+    try:
+        start = time.perf_counter()
+        results = list(steam_cli.run_lookups(service, steam_cli.lookup_details, steam_cli.read_inputs(path), args))
+        elapsed = (time.perf_counter() - start) * 1000
+        return elapsed, {"failed": sum(1 for result in results if not result["ok"])}
+    finally:
+        service.close()
+        os.remove(path)
+
+@scenario("watchlist_refresh")
+def watchlist_refresh(harness):
+    watchlist = Watchlist(":memory:")
+    watchlist.add((item["id"], item["name"]) for item in harness.store.catalog)
+    client = SteamClient(harness.url, backoff_base=harness.backoff_base)
+    tracker = PriceTracker(client, watchlist)
+    try:
+        start = time.perf_counter()
+        summary = tracker.refresh()
+        elapsed = (time.perf_counter() - start) * 1000
+        unchanged = tracker.refresh()
+        return elapsed, {"failed": summary["failed"], "rechanged": unchanged["changed"]}
+    finally:
+        client.close()
+        watchlist.close()
\ No newline at end of file
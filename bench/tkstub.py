@@ -0,0 +1,188 @@
+import heapq
+import itertools
+import sys
+import threading
+import time
+import types
+
+_queue = []
+_sequence = itertools.count()
+_ids = itertools.count(1)
+_cancelled = set()
+_lock = threading.Lock()
+_appearance = ["Dark"]
+
+def after(ms, fn=None, *args):
+    if fn is None:
+        time.sleep(ms / 1000)
+        return None
+    job = f"after#{next(_ids)}"
+    with _lock:
+        heapq.heappush(_queue, (time.perf_counter() + ms / 1000, next(_sequence), job, fn, args))
+    return job
+
+def run_pending():
+    while True:
+        with _lock:
+            if not _queue or _queue[0][0] > time.perf_counter():
+                return
+            _, _, job, fn, args = heapq.heappop(_queue)
+            if job in _cancelled:
+                _cancelled.discard(job)
+                continue
+        fn(*args)
+
+def reset():
+    with _lock:
+        _queue.clear()
+        _cancelled.clear()
+
+class Widget:
+    def __init__(self, master=None, *args, **kwargs):
+        self.master = master
+        self.options = dict(kwargs)
+        self.children = []
+        self.mapped = False
+        self.destroyed = False
+        self._text = ""
+        if isinstance(master, Widget):
+            master.children.append(self)
+    
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: None
+    
+    def __getitem__(self, key):
+        return self.cget(key)
+    
+    def __str__(self):
+        return f".!{type(self).__name__.lower()}{id(self)}"
+    
+    def pack(self, *args, **kwargs):
+        self.mapped = True
+    
+    grid = place = pack
+    
+    def pack_forget(self):
+        self.mapped = False
+    
+    grid_forget = place_forget = pack_forget
+    
+    def winfo_ismapped(self):
+        return self.mapped
+    
+    def winfo_exists(self):
+        return not self.destroyed
+    
+    def winfo_children(self):
+        return list(self.children)
+    
+    def winfo_height(self):
+        return self.options.get("height", 600)
+    
+    def winfo_width(self):
+        return self.options.get("width", 800)
+    
+    def winfo_reqheight(self):
+        return 30
+    
+    def winfo_y(self):
+        return 0
+    
+    def winfo_toplevel(self):
+        return self
+    
+    def destroy(self):
+        self.destroyed = True
+        if isinstance(self.master, Widget) and self in self.master.children:
+            self.master.children.remove(self)
+        for child in list(self.children):
+            child.destroy()
+    
+    def configure(self, **kwargs):
+        self.options.update(kwargs)
+    
+    config = configure
+    
+    def cget(self, key):
+        return self.options.get(key, "#000000" if "color" in key else 0)
+    
+    def bind(self, sequence=None, func=None, add=None):
+        return sequence
+    
+    bind_all = bind
+    
+    def after(self, ms, fn=None, *args):
+        return after(ms, fn, *args)
+    
+    def after_idle(self, fn, *args):
+        return after(0, fn, *args)
+    
+    def after_cancel(self, job):
+        with _lock:
+            _cancelled.add(job)
+    
+    def update(self):
+        run_pending()
+    
+    def mainloop(self):
+        pass
+    
+    def invoke(self):
+        command = self.options.get("command")
+        return command() if command else None
+    
+    def insert(self, index, text, *tags):
+        self._text = text + self._text if index == "1.0" else self._text + text
+    
+    def delete(self, first, last=None):
+        self._text = ""
+    
+    def get(self, *args):
+        return self._text
+    
+    def yview(self, *args):
+        return (0.0, 1.0)
+
+class OptionMenu(Widget):
+    def get(self):
+        return self.options.get("variable", (self.options.get("values") or [""])[0])
+    
+    def set(self, value):
+        self.options["variable"] = value
+
+def _widget_module(name, classes):
+    module = types.ModuleType(name)
+    for class_name in classes:
+        setattr(module, class_name, type(class_name, (Widget,), {}))
+    return module
+
+def install():
+    ctk = _widget_module("customtkinter", [
+        "CTk", "CTkFrame", "CTkLabel", "CTkButton", "CTkEntry", "CTkTextbox",
+        "CTkScrollableFrame", "CTkToplevel", "CTkScrollbar", "CTkCheckBox"
+    ])
+    ctk.CTkOptionMenu = type("CTkOptionMenu", (OptionMenu,), {})
+    ctk.CTkScrollableFrame._parent_canvas = property(lambda self: self)
+    ctk.CTkImage = type("CTkImage", (), {"__init__": lambda self, *args, **kwargs: None})
+    ctk.CTkFont = type("CTkFont", (), {
+        "__init__": lambda self, *args, **kwargs: None,
+        "measure": lambda self, text: 7 * len(text)
+    })
+    ctk.set_appearance_mode = lambda mode: _appearance.__setitem__(0, mode.capitalize())
+    ctk.get_appearance_mode = lambda: _appearance[0]
+    ctk.set_default_color_theme = lambda theme: None
+    ctk.ThemeManager = types.SimpleNamespace(theme={})
+    
+    tk = _widget_module("tkinter", ["Tk", "Frame", "Label", "Canvas", "Toplevel", "Text", "Scrollbar"])
+    tk.TclError = type("TclError", (Exception,), {})
+    tk.END = "end"
+    filedialog = types.ModuleType("tkinter.filedialog")
+    filedialog.askopenfilename = lambda **kwargs: ""
+    filedialog.asksaveasfilename = lambda **kwargs: ""
+    tk.filedialog = filedialog
+    
+    sys.modules["customtkinter"] = ctk
+    sys.modules["tkinter"] = tk
+    sys.modules["tkinter.filedialog"] = filedialog
\ No newline at end of file
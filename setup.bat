@@ -20,6 +20,7 @@ python -m pip install --upgrade pip
 echo Installing required packages...
 pip install customtkinter==5.2.1
 pip install requests==2.31.0
+pip install pillow==10.1.0
 
 echo.
 echo Installation complete! You can now run Crymson by double-clicking run.bat
@@ -0,0 +1,99 @@
+import hashlib
+import platform
+import uuid
+from datetime import datetime
+
+import customtkinter as ctk
+
+class AboutWindow:
+    def __init__(self, parent):
+        self.popup = ctk.CTkToplevel(parent)
+        self.popup.title("About Crymson")
+        self.popup.geometry("500x600")
+        self.popup.transient(parent)
+        self.popup.grab_set()
+        
+        self.colors = {
+            "crimson": "#DC143C",
+            "dark_grey": "#1A1A1A",
+            "light_grey": "#2D2D2D",
+            "text_grey": "#E6E6E6",
+            "accent": "#FF1F4D"
+        }
+        
+        self.popup.configure(fg_color=self.colors["dark_grey"])
+        
+        logo_frame = ctk.CTkFrame(self.popup, fg_color=self.colors["dark_grey"])
+        logo_frame.pack(fill="x", pady=(20, 0))
+        
+        title_label = ctk.CTkLabel(
+            logo_frame,
+            text="CRYMSON",
+            font=("Segoe UI", 32, "bold"),
+            text_color=self.colors["accent"]
+        )
+        title_label.pack(pady=(0, 5))
+        
+        version_label = ctk.CTkLabel(
+            logo_frame,
+            text=f"Version 1.1.0 ({platform.system()} Build)",
+            font=("Segoe UI", 12),
+            text_color=self.colors["text_grey"]
+        )
+        version_label.pack(pady=(0, 20))
+        
+        current_year = datetime.now().year
+        copyright_text = f"""
+© {current_year} Crymson Steam Browser
+All Rights Reserved
+
+SOFTWARE LICENSE AGREEMENT
+
+This software is protected under international
+copyright laws and treaties. This software is
+licensed, not sold. 
+
+TERMS OF USE:
+1. You may not modify, decompile, or reverse
+   engineer this software.
+2. You may not redistribute this software.
+3. You may not use this software for any
+   illegal purposes.
+
+This application is not affiliated with, endorsed by,
+or sponsored by Valve Corporation. Steam and the
+Steam logo are trademarks of Valve Corporation.
+
+This software uses the following open-source components:
+- CustomTkinter (MIT License)
+- Requests (Apache 2.0 License)
+
+Created with ♥ by the Crymson Team
+Build ID: {hashlib.sha256(str(uuid.getnode()).encode()).hexdigest()[:8]}
+        """
+        
+        copyright_box = ctk.CTkTextbox(
+            self.popup,
+            width=400,
+            height=350,
+            font=("Segoe UI", 12),
+            fg_color=self.colors["light_grey"],
+            text_color=self.colors["text_grey"],
+            border_width=1,
+            border_color=self.colors["accent"]
+        )
+        copyright_box.pack(padx=20, pady=10)
+        copyright_box.insert("1.0", copyright_text)
+        copyright_box.configure(state="disabled")
+        
+        close_btn = ctk.CTkButton(
+            self.popup,
+            text="Close",
+            command=self.popup.destroy,
+            fg_color=self.colors["accent"],
+            hover_color="#FF0F3D",
+            font=("Segoe UI", 12, "bold"),
+            height=35,
+            corner_radius=10
+        )
+        close_btn.pack(pady=20)
\ No newline at end of file
@@ -0,0 +1,142 @@
+import time
+
+import customtkinter as ctk
+
+from steam_metrics import metrics
+
+FRAME_MS = 16
+
+def resolve_color(widget, color):
+    if isinstance(color, (tuple, list)):
+        color = color[1] if ctk.get_appearance_mode() == "Dark" else color[0]
+    if isinstance(color, str) and color.startswith("#") and len(color) == 7:
+        return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+    try:
+        return tuple(channel // 257 for channel in widget.winfo_rgb(color))
+    except Exception:
+        return (0, 0, 0)
+
+def mix_colors(start, end, t):
+    return "#{:02x}{:02x}{:02x}".format(*(round(a + (b - a) * t) for a, b in zip(start, end)))
+
+def background_of(widget):
+    while widget is not None:
+        try:
+            color = widget.cget("fg_color")
+        except Exception:
+            color = None
+        if color and color != "transparent":
+            return color
+        widget = getattr(widget, "master", None)
+    return "#1A1A1A"
+
+def smoothstep(t):
+    return t * t * (3 - 2 * t)
+
+class Animation:
+    __slots__ = ("start", "duration", "step", "on_done", "state")
+    
+    def __init__(self, duration, step, on_done=None, state=None):
+        self.start = time.monotonic()
+        self.duration = duration
+        self.step = step
+        self.on_done = on_done
+        self.state = state
+    
+    def progress(self, now):
+        if self.duration <= 0:
+            return 1.0
+        return min(1.0, (now - self.start) / self.duration)
+
+class Animator:
+    def __init__(self, app, enabled=True, duration=0.2):
+        self.app = app
+        self.enabled = enabled
+        self.duration = duration
+        
+        self._animations = {}
+        self._job = None
+    
+    def animate(self, key, duration, step, on_done=None, state=None):
+        animation = Animation(duration, step, on_done, state)
+        self._animations[key] = animation
+        if not self.enabled:
+            self._finish(key, animation)
+            return animation
+        self._schedule()
+        return animation
+    
+    def cancel(self, key, finish=False):
+        animation = self._animations.pop(key, None)
+        if animation is not None and finish:
+            animation.step(1.0)
+            if animation.on_done:
+                animation.on_done()
+    
+    def is_running(self, key):
+        return key in self._animations
+    
+    def fade_content(self, widget, apply, color, duration=None):
+        key = (str(widget), "fade")
+        current = self._animations.get(key)
+        if not self.enabled:
+            self.cancel(key)
+            apply()
+            widget.configure(text_color=color)
+            return
+        
+        duration = self.duration if duration is None else duration
+        text_rgb = resolve_color(widget, color)
+        background_rgb = resolve_color(widget, background_of(widget))
+        state = {"apply": apply, "applied": False}
+        
+        offset = 0.0
+        if current is not None:
+            progress = current.progress(time.monotonic())
+            if not current.state["applied"]:
+                offset = progress
+            else:
+                offset = max(0.0, 1.0 - progress)
+        
+        def step(t):
+            t = min(1.0, offset + t * (1.0 - offset))
+            if t < 0.5:
+                widget.configure(text_color=mix_colors(text_rgb, background_rgb, smoothstep(t * 2)))
+                return
+            if not state["applied"]:
+                state["applied"] = True
+                state["apply"]()
+            widget.configure(text_color=mix_colors(background_rgb, text_rgb, smoothstep((t - 0.5) * 2)))
+        
+        def done():
+            widget.configure(text_color=color)
+        
+        self.animate(key, duration * (1.0 - offset), step, done, state)
+    
+    def _schedule(self):
+        if self._job is None and self._animations:
+            self._job = self.app.after(FRAME_MS, self._tick)
+    
+    def _tick(self):
+        self._job = None
+        now = time.monotonic()
+        with metrics.span("ui.animation_frame", animations=len(self._animations)):
+            for key, animation in list(self._animations.items()):
+                if self._animations.get(key) is not animation:
+                    continue
+                t = animation.progress(now)
+                try:
+                    if t >= 1.0:
+                        self._finish(key, animation)
+                    else:
+                        animation.step(t)
+                except Exception:
+                    self._animations.pop(key, None)
+        self._schedule()
+    
+    def _finish(self, key, animation):
+        if self._animations.get(key) is animation:
+            del self._animations[key]
+        animation.step(1.0)
+        if animation.on_done:
+            animation.on_done()
\ No newline at end of file
@@ -0,0 +1,231 @@
+import os
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from steam_metrics import metrics
+
+STORE_URL = os.environ.get("CRYMSON_STORE_URL", "https://store.steampowered.com")
+
+TIMEOUTS = {
+    "storesearch": (3.05, 10),
+    "appdetails": (3.05, 15),
+    "image": (3.05, 20),
+}
+DEFAULT_TIMEOUT = (3.05, 10)
+
+RATE_LIMITS = {
+    "appdetails": (200 / 300, 10),
+}
+DEFAULT_RATE_LIMIT = (2.0, 10)
+
+class SteamApiError(Exception):
+    pass
+
+class RateLimitError(SteamApiError):
+    pass
+
+class SteamUnavailableError(SteamApiError):
+    pass
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens=1):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+    
+    def available(self):
+        with self._lock:
+            return min(self.capacity, self._tokens + (time.monotonic() - self._updated) * self.rate)
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SteamClient:
+    def __init__(self, base_url=STORE_URL, pool_size=8, max_retries=4,
+                 backoff_base=1.0, backoff_cap=60.0):
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        
+        self.requests_sent = 0
+        self.retries = 0
+        self.throttled = 0
+        self.deduplicated = 0
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": "Crymson/1.1.0"
+        })
+        
+        self._limiters = {}
+        self._flights = {}
+        self._lock = threading.Lock()
+    
+    def get_json(self, endpoint, params):
+        key = (endpoint, tuple(sorted((name, str(value)) for name, value in params.items())))
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.deduplicated += 1
+        
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        
+        try:
+            flight.result = self._request(endpoint, params)
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+    
+    def _request(self, endpoint, params):
+        url = f"{self.base_url}/api/{endpoint}"
+        timeout = TIMEOUTS.get(endpoint, DEFAULT_TIMEOUT)
+        limiter = self._limiter(endpoint)
+        
+        for attempt in range(self.max_retries + 1):
+            limiter.acquire()
+            with self._lock:
+                self.requests_sent += 1
+            
+            try:
+                with metrics.span(f"http.{endpoint}", attempt=attempt):
+                    response = self.session.get(url, params=params, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise SteamUnavailableError(f"{endpoint} request failed: {e}") from e
+                self._backoff(attempt)
+                continue
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                if response.status_code == 429:
+                    with self._lock:
+                        self.throttled += 1
+                if attempt == self.max_retries:
+                    if response.status_code == 429:
+                        raise RateLimitError(f"{endpoint} is rate limited by Steam")
+                    raise SteamUnavailableError(f"{endpoint} returned HTTP {response.status_code}")
+                self._backoff(attempt, response.headers.get("Retry-After"))
+                continue
+            
+            if response.status_code >= 400:
+                raise SteamApiError(f"{endpoint} returned HTTP {response.status_code}")
+            
+            try:
+                with metrics.span(f"json.{endpoint}"):
+                    return response.json()
+            except ValueError as e:
+                raise SteamApiError(f"{endpoint} returned invalid JSON") from e
+    
+    def fetch_bytes(self, url):
+        with self._lock:
+            self.requests_sent += 1
+        try:
+            with metrics.span("http.image"):
+                response = self.session.get(url, timeout=TIMEOUTS["image"])
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise SteamUnavailableError(f"image request failed: {e}") from e
+        if response.status_code >= 400:
+            raise SteamApiError(f"image returned HTTP {response.status_code}")
+        return response.content
+    
+    def store_search(self, term, page=1, count=50, cc="US", l="english"):
+        return self.get_json("storesearch", {
+            "term": term,
+            "l": l,
+            "cc": cc,
+            "page": page,
+            "count": count
+        })
+    
+    def app_details(self, app_id, cc="US", l="english", filters=None):
+        params = {
+            "appids": app_id,
+            "cc": cc,
+            "l": l
+        }
+        if filters:
+            params["filters"] = filters
+        data = self.get_json("appdetails", params)
+        result = (data or {}).get(str(app_id)) or {}
+        if not result.get("success"):
+            raise SteamApiError(f"No store details for app {app_id}")
+        return result["data"]
+    
+    def app_details_batch(self, app_ids, cc="US", l="english", filters="price_overview"):
+        data = self.get_json("appdetails", {
+            "appids": ",".join(str(app_id) for app_id in app_ids),
+            "cc": cc,
+            "l": l,
+            "filters": filters
+        }) or {}
+        results = {}
+        for app_id in app_ids:
+            result = data.get(str(app_id)) or {}
+            details = result.get("data") if result.get("success") else None
+            results[app_id] = details if isinstance(details, dict) else {}
+        return results
+    
+    def headroom(self, endpoint):
+        limiter = self._limiter(endpoint)
+        return limiter.available() / limiter.capacity
+    
+    def close(self):
+        self.session.close()
+    
+    def _limiter(self, endpoint):
+        with self._lock:
+            limiter = self._limiters.get(endpoint)
+            if limiter is None:
+                rate, capacity = RATE_LIMITS.get(endpoint, DEFAULT_RATE_LIMIT)
+                limiter = self._limiters[endpoint] = TokenBucket(rate, capacity)
+            return limiter
+    
+    def _backoff(self, attempt, retry_after=None):
+        with self._lock:
+            self.retries += 1
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        time.sleep(delay)
\ No newline at end of file
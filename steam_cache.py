@@ -0,0 +1,324 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from steam_models import GameDetails, SearchPage
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".crymson")
+CACHE_PATH = os.path.join(CACHE_DIR, "cache.sqlite3")
+TOUCH_INTERVAL = 600
+BACKGROUND_WORKERS = 4
+
+background_pool = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="crymson-background")
+
+class PersistentCache:
+    def __init__(self, table, path=CACHE_PATH, ttl=3600, stale_ttl=86400,
+                 max_entries=256, max_disk_entries=5000, encode=None, decode=None):
+        self.table = table
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.encode = encode or (lambda value: value)
+        self.decode = decode or (lambda value: value)
+        self.on_store = None
+        
+        self.hits = 0
+        self.stale_hits = 0
+        self.offline_hits = 0
+        self.misses = 0
+        
+        self._memory = OrderedDict()
+        self._lock = threading.RLock()
+        self._refreshing = set()
+        self._writes = 0
+        self._closed = False
+        self._db = self._open()
+    
+    def _open(self):
+        try:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            if self.path != ":memory:":
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            db.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_accessed "
+                f"ON {self.table} (accessed_at)"
+            )
+            db.commit()
+            return db
+        except (OSError, sqlite3.Error):
+            return None
+    
+    def lookup(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry[0], now - entry[1]
+            
+            if self._db is None:
+                return None
+            
+            try:
+                row = self._db.execute(
+                    f"SELECT value, stored_at, accessed_at FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if now - row[2] > TOUCH_INTERVAL:
+                    self._db.execute(
+                        f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+                    )
+                    self._db.commit()
+                value = self.decode(json.loads(row[0]))
+            except (sqlite3.Error, ValueError, TypeError, KeyError):
+                return None
+            
+            self._remember(key, value, row[1])
+            return value, now - row[1]
+    
+    def store(self, key, value, stored_at=None):
+        stored_at = time.time() if stored_at is None else stored_at
+        with self._lock:
+            self._remember(key, value, stored_at)
+            if self.on_store:
+                self.on_store(key, value)
+            
+            if self._db is None:
+                return
+            
+            try:
+                self._db.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(self.encode(value), separators=(",", ":")), stored_at, stored_at)
+                )
+                self._writes += 1
+                if self._writes % 100 == 0:
+                    self._prune_disk()
+                self._db.commit()
+            except (sqlite3.Error, TypeError, ValueError):
+                pass
+    
+    def store_many(self, items, stored_at=None):
+        stored_at = time.time() if stored_at is None else stored_at
+        with self._lock:
+            for key, value in items:
+                self._remember(key, value, stored_at)
+            
+            if self._db is None:
+                return
+            
+            try:
+                self._db.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    ((key, json.dumps(self.encode(value), separators=(",", ":")), stored_at, stored_at)
+                     for key, value in items)
+                )
+                previous, self._writes = self._writes, self._writes + len(items)
+                if previous // 100 != self._writes // 100:
+                    self._prune_disk()
+                self._db.commit()
+            except (sqlite3.Error, TypeError, ValueError):
+                pass
+    
+    def invalidate(self, key):
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._db is not None:
+                try:
+                    self._db.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                    self._db.commit()
+                except sqlite3.Error:
+                    pass
+    
+    def fresh(self, key):
+        entry = self.lookup(key)
+        if entry is None or entry[1] >= self.ttl:
+            return None
+        self.hits += 1
+        return entry[0]
+    
+    def get(self, key, fetch, on_refresh=None, budget=None):
+        return self.get_entry(key, fetch, on_refresh, budget)[0]
+    
+    def get_entry(self, key, fetch, on_refresh=None, budget=None):
+        entry = self.lookup(key)
+        if entry is not None:
+            value, age = entry
+            if age < self.ttl:
+                self.hits += 1
+                return value, age, "fresh"
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._revalidate(key, fetch, on_refresh)
+                return value, age, "stale"
+        
+        self.misses += 1
+        try:
+            if entry is not None and budget is not None:
+                value = self._fetch_within(key, fetch, budget, on_refresh)
+                if value is None:
+                    self.offline_hits += 1
+                    return entry[0], entry[1], "offline"
+                return value, 0.0, "live"
+            value = fetch()
+        except Exception:
+            if entry is not None:
+                self.offline_hits += 1
+                return entry[0], entry[1], "offline"
+            raise
+        
+        self.store(key, value)
+        return value, 0.0, "live"
+    
+    def close(self):
+        with self._lock:
+            self._closed = True
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+    
+    def stale_keys(self, limit):
+        with self._lock:
+            if self._db is None:
+                return []
+            try:
+                rows = self._db.execute(
+                    f"SELECT key FROM {self.table} WHERE stored_at < ? "
+                    "ORDER BY accessed_at DESC LIMIT ?",
+                    (time.time() - self.ttl, limit)
+                ).fetchall()
+            except sqlite3.Error:
+                return []
+        return [row[0] for row in rows]
+    
+    def _fetch_within(self, key, fetch, budget, on_refresh):
+        future = background_pool.submit(self._refresh, key, fetch)
+        try:
+            return future.result(budget)
+        except FutureTimeout:
+            future.add_done_callback(lambda f: self._deliver(f, on_refresh))
+            return None
+    
+    def _revalidate(self, key, fetch, on_refresh):
+        with self._lock:
+            if key in self._refreshing or self._closed:
+                return
+            self._refreshing.add(key)
+        
+        future = background_pool.submit(self._refresh, key, fetch)
+        future.add_done_callback(lambda f: self._revalidated(key, f, on_refresh))
+    
+    def _revalidated(self, key, future, on_refresh):
+        with self._lock:
+            self._refreshing.discard(key)
+        self._deliver(future, on_refresh)
+    
+    @staticmethod
+    def _deliver(future, on_refresh):
+        if on_refresh and future.exception() is None and future.result() is not None:
+            on_refresh(future.result())
+    
+    def _refresh(self, key, fetch):
+        if self._closed:
+            return None
+        value = fetch()
+        self.store(key, value)
+        return value
+    
+    def _remember(self, key, value, stored_at):
+        self._memory[key] = (value, stored_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+    
+    def _prune_disk(self):
+        self._db.execute(
+            f"DELETE FROM {self.table} WHERE key IN ("
+            f"SELECT key FROM {self.table} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,)
+        )
+
+class DetailsCache(PersistentCache):
+    def __init__(self, path=CACHE_PATH, ttl=6 * 3600, stale_ttl=7 * 86400,
+                 max_entries=200, max_disk_entries=5000):
+        super().__init__("game_details", path, ttl, stale_ttl, max_entries, max_disk_entries,
+                         encode=GameDetails.to_dict, decode=GameDetails.from_dict)
+    
+    @staticmethod
+    def make_key(app_id, cc, l):
+        return f"{app_id}:{cc}:{l}"
+    
+    @staticmethod
+    def parse_key(key):
+        app_id, cc, l = key.split(":", 2)
+        return int(app_id), cc, l
+    
+    def get_details(self, app_id, cc, l, fetch, on_refresh=None, budget=None):
+        return self.get_entry(self.make_key(app_id, cc, l), fetch, on_refresh, budget)
+
+def normalize_query(query):
+    return " ".join(query.lower().split())
+
+class SearchPageCache(PersistentCache):
+    def __init__(self, path=CACHE_PATH, ttl=15 * 60, stale_ttl=86400,
+                 max_entries=64, max_disk_entries=2000):
+        super().__init__("search_results", path, ttl, stale_ttl, max_entries, max_disk_entries,
+                         encode=SearchPage.to_dict, decode=SearchPage.from_dict)
+        self._totals = {}
+    
+    @staticmethod
+    def make_key(query, page, count, cc, l):
+        return f"{normalize_query(query)}|{page}|{count}|{cc}|{l}"
+    
+    @staticmethod
+    def parse_key(key):
+        query, page, count, cc, l = key.rsplit("|", 4)
+        return query, int(page), int(count), cc, l
+    
+    def get_page(self, query, page, count, cc, l, fetch, on_refresh=None, budget=None):
+        entry = self.get_entry(self.make_key(query, page, count, cc, l), fetch, on_refresh, budget)
+        self._totals[(normalize_query(query), count, cc, l)] = entry[0].total
+        return entry
+    
+    def fresh_page(self, query, page, count, cc, l):
+        data = self.fresh(self.make_key(query, page, count, cc, l))
+        if data is not None:
+            self._totals[(normalize_query(query), count, cc, l)] = data.total
+        return data
+    
+    def total(self, query, count, cc, l):
+        key = (normalize_query(query), count, cc, l)
+        if key not in self._totals:
+            entry = self.lookup(self.make_key(query, 1, count, cc, l))
+            if entry is None:
+                return None
+            self._totals[key] = entry[0].total
+        return self._totals[key]
+    
+    def prefix_page(self, query, count, cc, l, min_length=1):
+        query = normalize_query(query)
+        terms = query.split()
+        for end in range(len(query) - 1, min_length - 1, -1):
+            data = self.fresh(self.make_key(query[:end], 1, count, cc, l))
+            if data is None or data.total > len(data.items):
+                continue
+            items = [item for item in data.items if all(term in normalize_query(item.name) for term in terms)]
+            return SearchPage(len(items), items)
+        return None
\ No newline at end of file
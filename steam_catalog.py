@@ -0,0 +1,148 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+
+from steam_cache import CACHE_DIR
+
+CATALOG_PATH = os.path.join(CACHE_DIR, "catalog.sqlite3")
+
+_STRIP_CHARS = re.compile(r"[™®©]")
+_SPACES = re.compile(r"\s+")
+
+def normalize_name(name):
+    return _SPACES.sub(" ", _STRIP_CHARS.sub("", name)).strip().lower()
+
+def load_app_list(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = (data.get("applist") or data.get("response") or data).get("apps", [])
+    for app in data:
+        app_id = app.get("appid", app.get("id"))
+        name = (app.get("name") or "").strip()
+        if app_id is not None and name:
+            yield int(app_id), name
+
+class CatalogIndex:
+    def __init__(self, path=CATALOG_PATH):
+        self.path = path
+        self.mode = None
+        self._lock = threading.Lock()
+        self._read_lock = self._lock if path == ":memory:" else threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._setup()
+        self._reader = self._db if path == ":memory:" else sqlite3.connect(path, check_same_thread=False)
+    
+    def _setup(self):
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS apps ("
+            "appid INTEGER PRIMARY KEY, name TEXT NOT NULL, norm TEXT NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS apps_norm ON apps (norm)")
+        for mode, tokenizer in (("trigram", "trigram"), ("fts", "unicode61")):
+            try:
+                self._db.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS apps_fts USING fts5("
+                    f"norm, content='apps', content_rowid='appid', tokenize='{tokenizer}')"
+                )
+                self.mode = mode
+                break
+            except sqlite3.OperationalError:
+                continue
+        else:
+            self.mode = "like"
+        self._db.commit()
+    
+    def count(self):
+        with self._read_lock:
+            return self._reader.execute("SELECT COUNT(*) FROM apps").fetchone()[0]
+    
+    def import_file(self, path):
+        return self.import_apps(load_app_list(path))
+    
+    def import_apps(self, apps):
+        rows = [(app_id, name, normalize_name(name)) for app_id, name in apps]
+        if not rows:
+            raise ValueError("app list contains no apps")
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM apps")
+            self._db.executemany("INSERT OR REPLACE INTO apps (appid, name, norm) VALUES (?, ?, ?)", rows)
+            if self.mode != "like":
+                self._db.execute("INSERT INTO apps_fts (apps_fts) VALUES ('rebuild')")
+        return self.count()
+    
+    def apps_after(self, app_id, limit=100):
+        with self._read_lock:
+            return self._reader.execute(
+                "SELECT appid, name FROM apps WHERE appid > ? ORDER BY appid LIMIT ?", (app_id, limit)
+            ).fetchall()
+    
+    def search(self, query, limit=50):
+        norm = normalize_name(query)
+        if not norm:
+            return []
+        
+        with self._read_lock:
+            rows = self._candidates(norm, max(limit * 4, 200))
+        
+        ranked = sorted(rows, key=lambda row: self._rank(norm, row[2]))
+        return [{"id": app_id, "name": name} for app_id, name, _ in ranked[:limit]]
+    
+    def _candidates(self, norm, limit):
+        prefix = self._reader.execute(
+            "SELECT appid, name, norm FROM apps WHERE norm >= ? AND norm < ? LIMIT ?",
+            (norm, norm + "\uffff", limit)
+        ).fetchall()
+        
+        if self.mode == "trigram" and len(norm) >= 3:
+            match = '"' + norm.replace('"', '""') + '"'
+        elif self.mode == "fts":
+            match = " ".join('"' + word.replace('"', '""') + '"*' for word in norm.split())
+        else:
+            match = None
+        
+        try:
+            if match:
+                others = self._reader.execute(
+                    "SELECT apps.appid, apps.name, apps.norm FROM apps_fts "
+                    "JOIN apps ON apps.appid = apps_fts.rowid "
+                    "WHERE apps_fts MATCH ? LIMIT ?",
+                    (match, limit)
+                ).fetchall()
+            elif self.mode == "like":
+                others = self._reader.execute(
+                    "SELECT appid, name, norm FROM apps WHERE norm LIKE ? LIMIT ?",
+                    ("%" + norm + "%", limit)
+                ).fetchall()
+            else:
+                others = []
+        except sqlite3.OperationalError:
+            others = []
+        
+        seen = {row[0] for row in prefix}
+        return prefix + [row for row in others if row[0] not in seen]
+    
+    @staticmethod
+    def _rank(norm, name):
+        position = name.find(norm)
+        word_start = position == 0 or (position > 0 and not name[position - 1].isalnum())
+        return (
+            name != norm,
+            position != 0,
+            not word_start,
+            position if position >= 0 else len(name),
+            abs(len(name) - len(norm))
+        )
+    
+    def close(self):
+        with self._lock:
+            if self._reader is not self._db:
+                with self._read_lock:
+                    self._reader.close()
+            self._db.close()
\ No newline at end of file
@@ -0,0 +1,254 @@
+import argparse
+import json
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from steam_api import STORE_URL, SteamApiError, SteamClient
+from steam_cache import CACHE_PATH
+from steam_core import SteamService
+from steam_metrics import metrics
+
+def read_inputs(path):
+    stream = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        for line in stream:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def lookup_details(service, value, args):
+    app_id = int(value)
+    entry = service.fresh_details_entry(app_id, args.cc, args.lang) if args.cached else None
+    details, age = entry or (service.refresh_details(app_id, args.cc, args.lang), 0.0)
+    return {"appid": app_id, "ok": True, "age": round(age, 1), "data": details.to_dict()}
+
+def lookup_search(service, value, args):
+    pages = []
+    age = 0.0
+    for page in range(1, args.pages + 1):
+        entry = service.fresh_search_entry(value, page, args.count, args.cc, args.lang) if args.cached else None
+        data, page_age = entry or (service.refresh_search(value, page, args.count, args.cc, args.lang), 0.0)
+        age = max(age, page_age)
+        pages.extend(item.to_dict() for item in data.items)
+        if page * args.count >= data.total:
+            break
+    return {"query": value, "ok": True, "age": round(age, 1), "total": len(pages), "items": pages}
+
+def run_region_prices(service, inputs, args):
+    from steam_regions import REGIONS, RegionPrices
+    regions = [cc.strip().upper() for cc in args.regions.split(",") if cc.strip()] if args.regions else REGIONS
+    fetcher = RegionPrices(service, regions, workers=args.workers)
+    batch = []
+    for value in inputs:
+        try:
+            batch.append(int(value))
+        except ValueError:
+            yield {"appid": value, "ok": False, "error": "invalid app ID"}
+            continue
+        if len(batch) == fetcher.batch_size:
+            yield from region_results(fetcher, batch)
+            batch = []
+    if batch:
+        yield from region_results(fetcher, batch)
+
+def region_results(fetcher, app_ids):
+    from steam_layout import format_price
+    try:
+        prices = fetcher.fetch(app_ids)
+    except SteamApiError as e:
+        for app_id in app_ids:
+            yield {"appid": app_id, "ok": False, "error": str(e)}
+        return
+    for app_id in app_ids:
+        yield {"appid": app_id, "ok": bool(prices[app_id]), "prices": {
+            cc: price and dict(price, formatted=format_price(price.get("final"), price.get("currency")))
+            for cc, price in prices[app_id].items()
+        }}
+
+def run_lookups(service, lookup, inputs, args):
+    key = "appid" if lookup is lookup_details else "query"
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        pending = {}
+        for value in inputs:
+            if len(pending) >= args.workers * 4:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield collect(future, pending.pop(future), key)
+            pending[executor.submit(lookup, service, value, args)] = value
+        for future in list(pending):
+            yield collect(future, pending.pop(future), key)
+
+def collect(future, value, key):
+    try:
+        return future.result()
+    except Exception as e:
+        return {key: value, "ok": False, "error": str(e)}
+
+def parse_watch_line(value):
+    parts = value.replace(",", " ", 1).split(None, 1)
+    return int(parts[0]), parts[1] if len(parts) > 1 else ""
+
+def run_watch(args):
+    from steam_watchlist import PriceTracker, Watchlist
+    watchlist = Watchlist()
+    client = SteamClient(args.store_url)
+    try:
+        if args.action == "add":
+            count = watchlist.add(parse_watch_line(value) for value in read_inputs(args.input))
+            write_results([{"ok": True, "added": count}], args.format)
+        elif args.action == "remove":
+            count = watchlist.remove([int(value) for value in read_inputs(args.input)])
+            write_results([{"ok": True, "removed": count}], args.format)
+        elif args.action == "refresh":
+            summary = PriceTracker(client, watchlist).refresh(args.cc, args.lang, args.max_age)
+            summary["drops"] = [
+                {"appid": app_id, "previous": previous, "final": final}
+                for app_id, (previous, final) in summary["drops"].items()
+            ]
+            write_results([dict(summary, ok=not summary["failed"])], args.format)
+        elif args.action == "list":
+            write_results((
+                {"appid": app_id, "name": name, "final": final, "initial": initial, "currency": currency,
+                 "previous_final": previous, "checked_at": checked_at}
+                for app_id, name, final, initial, currency, previous, checked_at in watchlist.items(args.cc)
+            ), args.format)
+        else:
+            write_results((
+                {"appid": app_id, "previous": previous, "final": final}
+                for app_id, (previous, final) in watchlist.drops(args.cc).items()
+            ), args.format)
+    except BrokenPipeError:
+        pass
+    finally:
+        client.close()
+        watchlist.close()
+        if args.metrics:
+            metrics.export(args.metrics)
+    return 0
+
+def run_crawl(service, args):
+    from steam_cache import normalize_query
+    from steam_crawl import Crawler, catalog_units, open_writer, search_units
+    catalog = None
+    if args.term:
+        source = f"search:{normalize_query(args.term)}:{args.count}"
+        units = lambda cursor: search_units(service, args.term, args.count, cursor, args.cached)
+    else:
+        from steam_catalog import CatalogIndex
+        catalog = CatalogIndex()
+        source = "catalog"
+        units = lambda cursor: catalog_units(catalog, cursor=cursor)
+    source = f"{source}:{args.cc}:{args.lang}:{'details' if args.details else 'list'}"
+    
+    writer = open_writer(args.output)
+    crawler = Crawler(service, writer, workers=args.workers, details=args.details, cached=args.cached)
+    try:
+        summary = crawler.run(source, units, args.restart)
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        crawler.stop()
+        writer.close()
+        if catalog is not None:
+            catalog.close()
+    write_results([dict(summary, ok=summary["done"], failed=crawler.failed)], args.format)
+    return 0 if summary["done"] else 1
+
+def write_results(results, output_format, out=sys.stdout):
+    if output_format == "json":
+        json.dump(list(results), out, ensure_ascii=False)
+        out.write("\n")
+        return
+    for result in results:
+        out.write(json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n")
+        out.flush()
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="steam_cli", description="Headless Steam store lookups")
+    parser.add_argument("--cc", default="US", help="store country code")
+    parser.add_argument("--lang", default="english", help="store language")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent lookups")
+    parser.add_argument("--format", choices=("ndjson", "json"), default="ndjson")
+    parser.add_argument("--no-cache", action="store_true", help="keep caches in memory only")
+    parser.add_argument("--cached", action="store_true",
+                        help="answer details, search and crawl lookups from fresh cache entries when available")
+    parser.add_argument("--store-url", default=STORE_URL, help="store API base URL")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="write timings and counters on exit (.trace.json for Chrome trace format)")
+    
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    details = commands.add_parser("details", help="fetch appdetails for app IDs")
+    details.add_argument("input", nargs="?", default="-", help="file of app IDs, or - for stdin")
+    
+    search = commands.add_parser("search", help="run store searches for queries")
+    search.add_argument("input", nargs="?", default="-", help="file of queries, or - for stdin")
+    search.add_argument("--pages", type=int, default=1)
+    search.add_argument("--count", type=int, default=50)
+    
+    catalog = commands.add_parser("import-catalog", help="import a Steam app list JSON dump")
+    catalog.add_argument("input")
+    
+    prices = commands.add_parser("prices", help="compare prices for app IDs across store regions")
+    prices.add_argument("input", nargs="?", default="-", help="file of app IDs, or - for stdin")
+    prices.add_argument("--regions", help="comma-separated country codes (default: CRYMSON_REGIONS or a built-in set)")
+    
+    watch = commands.add_parser("watch", help="manage the price watchlist")
+    watch.add_argument("action", choices=("add", "remove", "refresh", "list", "drops"))
+    watch.add_argument("input", nargs="?", default="-",
+                       help="file of app IDs (optionally followed by a name) for add/remove, or - for stdin")
+    watch.add_argument("--max-age", type=float, default=0, help="skip apps checked within this many seconds")
+    
+    crawl = commands.add_parser("crawl", help="walk store search pages or the imported app list into a file")
+    crawl.add_argument("output", help="NDJSON file, or a .db/.sqlite/.sqlite3 database")
+    crawl.add_argument("--term", help="crawl store search results for this term instead of the app list")
+    crawl.add_argument("--count", type=int, default=50, help="search results per page")
+    crawl.add_argument("--no-details", dest="details", action="store_false", help="skip appdetails enrichment")
+    crawl.add_argument("--restart", action="store_true", help="ignore the checkpoint and start over")
+    
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    
+    if args.command == "import-catalog":
+        from steam_catalog import CatalogIndex
+        count = CatalogIndex().import_file(args.input)
+        write_results([{"ok": True, "imported": count}], args.format)
+        return 0
+    
+    if args.command == "watch":
+        return run_watch(args)
+    
+    cache_path = ":memory:" if args.no_cache else CACHE_PATH
+    service = SteamService(SteamClient(args.store_url), cc=args.cc, l=args.lang, cache_path=cache_path,
+                           latency_budget=None)
+    if args.metrics:
+        service.register_metrics(metrics)
+    if args.command == "crawl":
+        try:
+            return run_crawl(service, args)
+        finally:
+            service.close()
+            if args.metrics:
+                metrics.export(args.metrics)
+    if args.command == "prices":
+        results = run_region_prices(service, read_inputs(args.input), args)
+    else:
+        lookup = lookup_details if args.command == "details" else lookup_search
+        results = run_lookups(service, lookup, read_inputs(args.input), args)
+    try:
+        write_results(results, args.format)
+    except BrokenPipeError:
+        pass
+    finally:
+        service.close()
+        if args.metrics:
+            metrics.export(args.metrics)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,76 @@
+import customtkinter as ctk
+
+from steam_layout import format_price, render_table
+
+def price_cell(prices, cc):
+    if cc not in prices:
+        return "?"
+    price = prices[cc]
+    if not price:
+        return "-"
+    return format_price(price.get("final"), price.get("currency"))
+
+def game_table(prices, regions):
+    rows = []
+    for cc in regions:
+        price = prices.get(cc)
+        if not price:
+            rows.append([cc, price_cell(prices, cc), "", ""])
+            continue
+        discount = price.get("discount_percent") or 0
+        rows.append([
+            cc,
+            format_price(price.get("final"), price.get("currency")),
+            format_price(price.get("initial"), price.get("currency")) if discount else "",
+            f"-{discount}%" if discount else ""
+        ])
+    return render_table(["Region", "Price", "Regular", "Discount"], rows)
+
+def page_table(games, prices, regions):
+    rows = [[game.name[:40]] + [price_cell(prices.get(game.id, {}), cc) for cc in regions] for game in games]
+    return render_table(["Game"] + list(regions), rows)
+
+class RegionComparisonWindow:
+    def __init__(self, parent, games, prices, regions):
+        self.popup = ctk.CTkToplevel(parent)
+        self.popup.title(f"Regional prices - {games[0].name}" if len(games) == 1 else "Regional prices")
+        self.popup.geometry("900x600")
+        self.popup.transient(parent)
+        
+        self.colors = {
+            "crimson": "#DC143C",
+            "dark_grey": "#1A1A1A",
+            "light_grey": "#2D2D2D",
+            "text_grey": "#E6E6E6",
+            "accent": "#FF1F4D"
+        }
+        
+        self.popup.configure(fg_color=self.colors["dark_grey"])
+        
+        title_label = ctk.CTkLabel(
+            self.popup,
+            text=games[0].name if len(games) == 1 else f"{len(games)} games in {len(regions)} regions",
+            font=("Segoe UI", 20, "bold"),
+            text_color=self.colors["accent"]
+        )
+        title_label.pack(pady=(15, 5))
+        
+        note_label = ctk.CTkLabel(
+            self.popup,
+            text="Local store prices, not converted.  - not sold or free   ? not reached",
+            font=("Segoe UI", 11),
+            text_color=self.colors["text_grey"]
+        )
+        note_label.pack(pady=(0, 10))
+        
+        table = game_table(prices[games[0].id], regions) if len(games) == 1 else page_table(games, prices, regions)
+        textbox = ctk.CTkTextbox(
+            self.popup,
+            font=("Consolas", 12),
+            wrap="none",
+            fg_color=self.colors["light_grey"],
+            text_color=self.colors["text_grey"]
+        )
+        textbox.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        textbox.insert("1.0", table)
+        textbox.configure(state="disabled")
\ No newline at end of file
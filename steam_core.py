@@ -0,0 +1,178 @@
+import json
+import os
+import time
+
+from steam_api import RateLimitError, SteamClient, SteamUnavailableError
+from steam_cache import CACHE_DIR, CACHE_PATH, DetailsCache, PersistentCache, SearchPageCache
+from steam_models import DETAIL_FILTERS, GameDetails, SearchPage
+
+SNAPSHOT_PATH = os.path.join(CACHE_DIR, "session.json")
+
+class SteamService:
+    def __init__(self, client=None, cc="US", l="english", cache_path=CACHE_PATH,
+                 snapshot_path=SNAPSHOT_PATH, latency_budget=1.5):
+        self.client = client or SteamClient()
+        self.cc = cc
+        self.l = l
+        self.snapshot_path = snapshot_path
+        self.latency_budget = latency_budget
+        self.offline_since = None
+        
+        self.details_cache = DetailsCache(cache_path)
+        self.price_cache = PersistentCache("prices", cache_path, ttl=3600, max_entries=2000)
+        self.search_cache = SearchPageCache(cache_path)
+    
+    @property
+    def offline(self):
+        return self.offline_since is not None
+    
+    def search(self, query, page=1, count=50, cc=None, l=None):
+        return self.search_entry(query, page, count, cc, l)[0]
+    
+    def search_entry(self, query, page=1, count=50, cc=None, l=None, on_refresh=None):
+        cc, l = cc or self.cc, l or self.l
+        return self.search_cache.get_page(
+            query, page, count, cc, l,
+            lambda: self.fetch_search(query, page, count, cc, l),
+            on_refresh, self.latency_budget
+        )
+    
+    def fetch_search(self, query, page=1, count=50, cc=None, l=None):
+        cc, l = cc or self.cc, l or self.l
+        return self._tracked(lambda: SearchPage.from_api(self.client.store_search(query, page, count, cc, l)))
+    
+    def refresh_search(self, query, page=1, count=50, cc=None, l=None):
+        cc, l = cc or self.cc, l or self.l
+        data = self.fetch_search(query, page, count, cc, l)
+        self.search_cache.store(self.search_cache.make_key(query, page, count, cc, l), data)
+        return data
+    
+    def cached_search(self, query, page=1, count=50, cc=None, l=None):
+        return self.search_cache.fresh_page(query, page, count, cc or self.cc, l or self.l)
+    
+    def fresh_search_entry(self, query, page=1, count=50, cc=None, l=None):
+        key = self.search_cache.make_key(query, page, count, cc or self.cc, l or self.l)
+        return self._fresh_entry(self.search_cache, key)
+    
+    def prefix_search(self, query, count=50, cc=None, l=None, min_length=1):
+        return self.search_cache.prefix_page(query, count, cc or self.cc, l or self.l, min_length)
+    
+    def cached_total(self, query, count=50, cc=None, l=None):
+        return self.search_cache.total(query, count, cc or self.cc, l or self.l)
+    
+    def app_details(self, app_id, cc=None, l=None, on_refresh=None):
+        return self.details_entry(app_id, cc, l, on_refresh)[0]
+    
+    def details_entry(self, app_id, cc=None, l=None, on_refresh=None):
+        cc, l = cc or self.cc, l or self.l
+        return self.details_cache.get_details(
+            app_id, cc, l, lambda: self.fetch_details(app_id, cc, l), on_refresh, self.latency_budget
+        )
+    
+    def fetch_details(self, app_id, cc=None, l=None):
+        cc, l = cc or self.cc, l or self.l
+        return self._tracked(
+            lambda: GameDetails.from_api(app_id, self.client.app_details(app_id, cc, l, DETAIL_FILTERS))
+        )
+    
+    def refresh_details(self, app_id, cc=None, l=None):
+        cc, l = cc or self.cc, l or self.l
+        details = self.fetch_details(app_id, cc, l)
+        self.details_cache.store(self.details_cache.make_key(app_id, cc, l), details)
+        return details
+    
+    def _tracked(self, fetch):
+        try:
+            value = fetch()
+        except (SteamUnavailableError, RateLimitError):
+            if self.offline_since is None:
+                self.offline_since = time.time()
+            raise
+        self.offline_since = None
+        return value
+    
+    def cached_details(self, app_id, cc=None, l=None):
+        entry = self.details_cache.lookup(self.details_cache.make_key(app_id, cc or self.cc, l or self.l))
+        return entry[0] if entry is not None else None
+    
+    def details_fresh(self, app_id, cc=None, l=None):
+        return self.fresh_details_entry(app_id, cc, l) is not None
+    
+    def fresh_details_entry(self, app_id, cc=None, l=None):
+        return self._fresh_entry(self.details_cache, self.details_cache.make_key(app_id, cc or self.cc, l or self.l))
+    
+    @staticmethod
+    def _fresh_entry(cache, key):
+        entry = cache.lookup(key)
+        return entry if entry is not None and entry[1] < cache.ttl else None
+    
+    @staticmethod
+    def price_key(app_id, cc):
+        return f"{app_id}:{cc}"
+    
+    def cached_price(self, app_id, cc=None):
+        entry = self.price_cache.lookup(self.price_key(app_id, cc or self.cc))
+        return entry[0] if entry is not None else None
+    
+    def cached_prices(self, app_ids, cc=None):
+        cc = cc or self.cc
+        known, missing = {}, []
+        for app_id in app_ids:
+            entry = self.price_cache.lookup(self.price_key(app_id, cc))
+            if entry is not None and entry[1] < self.price_cache.ttl:
+                known[app_id] = entry[0]
+            else:
+                missing.append(app_id)
+        return known, missing
+    
+    def fetch_prices(self, app_ids, cc=None, l=None):
+        cc, l = cc or self.cc, l or self.l
+        data = self._tracked(lambda: self.client.app_details_batch(app_ids, cc, l, filters="price_overview"))
+        prices = {app_id: details.get("price_overview") for app_id, details in data.items()}
+        self.price_cache.store_many([(self.price_key(app_id, cc), price) for app_id, price in prices.items()])
+        return prices
+    
+    def save_snapshot(self, query, page, data):
+        snapshot = {
+            "query": query,
+            "page": page,
+            "cc": self.cc,
+            "l": self.l,
+            "saved_at": time.time(),
+            "data": data.to_dict()
+        }
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+            temp_path = f"{self.snapshot_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+            os.replace(temp_path, self.snapshot_path)
+        except OSError:
+            pass
+    
+    def load_snapshot(self):
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot["cc"] != self.cc or snapshot["l"] != self.l:
+                return None
+            return snapshot["query"], snapshot["page"], SearchPage.from_dict(snapshot["data"]), snapshot["saved_at"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def register_metrics(self, metrics):
+        metrics.watch("http.requests", lambda: self.client.requests_sent)
+        metrics.watch("http.retries", lambda: self.client.retries)
+        metrics.watch("http.throttled", lambda: self.client.throttled)
+        metrics.watch("http.deduplicated", lambda: self.client.deduplicated)
+        for name, cache in (("details", self.details_cache), ("prices", self.price_cache),
+                            ("search", self.search_cache)):
+            metrics.watch(f"cache.{name}.hits", lambda cache=cache: cache.hits)
+            metrics.watch(f"cache.{name}.stale_hits", lambda cache=cache: cache.stale_hits)
+            metrics.watch(f"cache.{name}.offline_hits", lambda cache=cache: cache.offline_hits)
+            metrics.watch(f"cache.{name}.misses", lambda cache=cache: cache.misses)
+    
+    def close(self):
+        self.client.close()
+        for cache in (self.details_cache, self.price_cache, self.search_cache):
+            cache.close()
\ No newline at end of file
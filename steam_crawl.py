@@ -0,0 +1,244 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from steam_api import RateLimitError, SteamApiError, SteamUnavailableError
+from steam_metrics import metrics
+
+CRAWL_QUEUE_SIZE = 4
+CATALOG_CHUNK = 100
+
+_DONE = object()
+
+class _Failure:
+    __slots__ = ("error",)
+    
+    def __init__(self, error):
+        self.error = error
+
+def search_units(service, term, count=50, cursor=None, cached=False):
+    page = (cursor or 0) + 1
+    while True:
+        entry = service.fresh_search_entry(term, page, count) if cached else None
+        data, age = entry or (service.refresh_search(term, page, count), 0.0)
+        if not data.items:
+            return
+        yield page, [dict(item.to_dict(), age=round(age, 1)) for item in data.items]
+        if page * count >= data.total:
+            return
+        page += 1
+
+def catalog_units(catalog, chunk=CATALOG_CHUNK, cursor=None):
+    after = cursor or 0
+    while True:
+        apps = catalog.apps_after(after, chunk)
+        if not apps:
+            return
+        after = apps[-1][0]
+        yield after, [{"id": app_id, "name": name} for app_id, name in apps]
+
+class NdjsonWriter:
+    def __init__(self, path):
+        self.path = path
+        self.checkpoint_path = f"{path}.checkpoint"
+        self._file = None
+    
+    def start(self, source, restart=False):
+        state = None if restart else self._load(source)
+        self._file = open(self.path, "ab" if state else "wb")
+        if state:
+            self._file.truncate(state["offset"])
+        return state
+    
+    def write(self, source, cursor, written, rows, done=False):
+        self._file.write(b"".join(
+            json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n" for row in rows
+        ))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._save({"source": source, "cursor": cursor, "written": written, "done": done,
+                    "offset": self._file.tell()})
+    
+    def _load(self, source):
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state["source"] != source or os.path.getsize(self.path) < state["offset"]:
+                return None
+            return state
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save(self, state):
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.checkpoint_path)
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+class SqliteWriter:
+    def __init__(self, path):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS apps ("
+            "appid INTEGER PRIMARY KEY, name TEXT, ok INTEGER NOT NULL, data TEXT NOT NULL, crawled_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS crawl_state ("
+            "id INTEGER PRIMARY KEY CHECK (id = 1), source TEXT NOT NULL, cursor INTEGER, "
+            "written INTEGER NOT NULL, done INTEGER NOT NULL)"
+        )
+        self._db.commit()
+    
+    def start(self, source, restart=False):
+        row = self._db.execute("SELECT source, cursor, written, done FROM crawl_state").fetchone()
+        if row is not None and row[0] == source and not restart:
+            return {"source": source, "cursor": row[1], "written": row[2], "done": bool(row[3])}
+        self._db.execute("DELETE FROM apps")
+        self._db.execute("DELETE FROM crawl_state")
+        self._db.commit()
+        return None
+    
+    def write(self, source, cursor, written, rows, done=False):
+        now = time.time()
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO apps (appid, name, ok, data, crawled_at) VALUES (?, ?, ?, ?, ?)",
+                ((row["appid"], row.get("name"), row["ok"], json.dumps(row, ensure_ascii=False), now) for row in rows)
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO crawl_state (id, source, cursor, written, done) VALUES (1, ?, ?, ?, ?)",
+                (source, cursor, written, done)
+            )
+    
+    def close(self):
+        self._db.close()
+
+def open_writer(path):
+    if path.endswith((".db", ".sqlite", ".sqlite3")):
+        return SqliteWriter(path)
+    return NdjsonWriter(path)
+
+class Crawler:
+    def __init__(self, service, writer, workers=4, details=True, cached=False, queue_size=CRAWL_QUEUE_SIZE):
+        self.service = service
+        self.writer = writer
+        self.workers = workers
+        self.details = details
+        self.cached = cached
+        self.queue_size = queue_size
+        
+        self.units = 0
+        self.written = 0
+        self.failed = 0
+        
+        self._stop = threading.Event()
+    
+    def run(self, source, units, restart=False, on_progress=None):
+        state = self.writer.start(source, restart)
+        cursor = state["cursor"] if state else None
+        self.written = state["written"] if state else 0
+        summary = {"source": source, "resumed": state is not None, "stopped": None}
+        if state and state["done"]:
+            return dict(summary, cursor=cursor, written=self.written, done=True)
+        
+        self._stop.clear()
+        done = False
+        fetched = self._stage(units(cursor))
+        enriched = self._stage(self._enrich(self._drain(fetched)))
+        try:
+            for cursor, rows in self._drain(enriched):
+                self.written += len(rows)
+                self.units += 1
+                with metrics.span("crawl.write", rows=len(rows)):
+                    self.writer.write(source, cursor, self.written, rows)
+                if on_progress:
+                    on_progress(self.units, self.written)
+            if self._stop.is_set():
+                summary["stopped"] = "interrupted"
+            else:
+                self.writer.write(source, cursor, self.written, [], done=True)
+                done = True
+        except SteamApiError as e:
+            summary["stopped"] = str(e)
+        finally:
+            self._stop.set()
+        return dict(summary, cursor=cursor, written=self.written, done=done)
+    
+    def stop(self):
+        self._stop.set()
+    
+    def _stage(self, items):
+        outbox = queue.Queue(self.queue_size)
+        
+        def pump():
+            try:
+                for item in items:
+                    if not self._put(outbox, item):
+                        return
+            except Exception as e:
+                self._put(outbox, _Failure(e))
+                return
+            self._put(outbox, _DONE)
+        
+        threading.Thread(target=pump, name="crymson-crawl", daemon=True).start()
+        return outbox
+    
+    def _put(self, outbox, item):
+        while not self._stop.is_set():
+            try:
+                outbox.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _drain(self, inbox):
+        while True:
+            try:
+                item = inbox.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    
+    def _enrich(self, units):
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for cursor, items in units:
+                with metrics.span("crawl.enrich", items=len(items)):
+                    rows = list(executor.map(self._row, items)) if self.details else [self._row(item) for item in items]
+                yield cursor, rows
+    
+    def _row(self, item):
+        row = {"appid": item["id"], "name": item["name"], "ok": True}
+        listing = {key: value for key, value in item.items() if key not in ("id", "name", "age")}
+        if listing:
+            row["listing"] = listing
+        if "age" in item:
+            row["age"] = item["age"]
+        if not self.details:
+            return row
+        try:
+            entry = self.service.fresh_details_entry(item["id"]) if self.cached else None
+            details, age = entry or (self.service.refresh_details(item["id"]), 0.0)
+            row["data"] = details.to_dict()
+            row["age"] = max(row.get("age", 0.0), round(age, 1))
+        except (RateLimitError, SteamUnavailableError):
+            raise
+        except SteamApiError as e:
+            self.failed += 1
+            row.update(ok=False, error=str(e))
+        return row
\ No newline at end of file
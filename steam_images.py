@@ -0,0 +1,135 @@
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from steam_cache import CACHE_DIR
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+THUMBNAIL_DIR = os.path.join(CACHE_DIR, "thumbnails")
+
+class ImageLoader:
+    def __init__(self, client, dispatch, cache_dir=THUMBNAIL_DIR,
+                 max_memory_bytes=48 * 1024 * 1024, workers=4):
+        self.client = client
+        self.dispatch = dispatch
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.downloads = 0
+        
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._pending = {}
+        self._futures = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crymson-images")
+    
+    @property
+    def available(self):
+        return Image is not None
+    
+    def load(self, url, size, callback):
+        if not self.available or not url:
+            return
+        
+        key = (url, tuple(size))
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+            else:
+                waiting = self._pending.get(key)
+                if waiting is not None:
+                    waiting.append(callback)
+                    return
+                self._pending[key] = [callback]
+        
+        if image is not None:
+            callback(image)
+            return
+        
+        future = self._executor.submit(self._fetch, key)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+    
+    def shutdown(self):
+        with self._lock:
+            futures, self._futures = self._futures, set()
+        for future in futures:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+    
+    def _forget(self, future):
+        with self._lock:
+            self._futures.discard(future)
+    
+    def _fetch(self, key):
+        url, size = key
+        image = None
+        try:
+            image = self._read_disk(key)
+            if image is None:
+                data = self.client.fetch_bytes(url)
+                self.downloads += 1
+                image = Image.open(io.BytesIO(data))
+                image.thumbnail(size, Image.LANCZOS)
+                image = image.convert("RGB")
+                self._write_disk(key, image)
+            else:
+                self.disk_hits += 1
+        except Exception:
+            image = None
+        
+        with self._lock:
+            callbacks = self._pending.pop(key, [])
+            if image is not None:
+                self._remember(key, image)
+        
+        if image is not None:
+            for callback in callbacks:
+                self.dispatch(callback, image)
+    
+    def _remember(self, key, image):
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= self._image_bytes(previous)
+        self._memory[key] = image
+        self._memory_bytes += self._image_bytes(image)
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= self._image_bytes(evicted)
+    
+    @staticmethod
+    def _image_bytes(image):
+        return image.width * image.height * len(image.getbands())
+    
+    def _disk_path(self, key):
+        url, size = key
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}_{size[0]}x{size[1]}.jpg")
+    
+    def _read_disk(self, key):
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        with Image.open(path) as image:
+            image.load()
+            return image.copy()
+    
+    def _write_disk(self, key, image):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            image.save(self._disk_path(key), "JPEG", quality=85)
+        except OSError:
+            pass
\ No newline at end of file
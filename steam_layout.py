@@ -0,0 +1,195 @@
+import html
+import threading
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from html.parser import HTMLParser
+
+BOX_STYLES = {
+    "single": ("┌", "┐", "└", "┘", "─", "│"),
+    "double": ("╔", "╗", "╚", "╝", "═", "║"),
+}
+
+_char_widths = {}
+
+def char_width(char):
+    width = _char_widths.get(char)
+    if width is None:
+        if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+            width = 0
+        elif unicodedata.east_asian_width(char) in ("W", "F"):
+            width = 2
+        else:
+            width = 1
+        _char_widths[char] = width
+    return width
+
+def text_width(text):
+    if text.isascii():
+        return len(text)
+    return sum(char_width(char) for char in text)
+
+def wrap_line(line, width):
+    rows = []
+    current = []
+    current_width = 0
+    
+    for word in line.split():
+        word_width = text_width(word)
+        
+        if current and current_width + 1 + word_width <= width:
+            current.append(word)
+            current_width += 1 + word_width
+            continue
+        
+        if current:
+            rows.append((" ".join(current), current_width))
+            current = []
+            current_width = 0
+        
+        if word_width <= width:
+            current = [word]
+            current_width = word_width
+            continue
+        
+        chunk = []
+        chunk_width = 0
+        for char in word:
+            w = char_width(char)
+            if chunk_width + w > width:
+                rows.append(("".join(chunk), chunk_width))
+                chunk = []
+                chunk_width = 0
+            chunk.append(char)
+            chunk_width += w
+        current = ["".join(chunk)]
+        current_width = chunk_width
+    
+    if current:
+        rows.append((" ".join(current), current_width))
+    return rows
+
+@lru_cache(maxsize=64)
+def box_template(width, style):
+    top_left, top_right, bottom_left, bottom_right, horizontal, vertical = BOX_STYLES.get(style, BOX_STYLES["single"])
+    return (
+        f"{top_left}{horizontal * (width + 2)}{top_right}",
+        f"{bottom_left}{horizontal * (width + 2)}{bottom_right}",
+        f"{vertical} ",
+        f" {vertical}",
+        f"{vertical} {' ' * width} {vertical}"
+    )
+
+@lru_cache(maxsize=256)
+def render_box(text, width=60, style="single"):
+    top, bottom, left, right, blank = box_template(width, style)
+    rows = [top]
+    for line in text.split("\n"):
+        wrapped = wrap_line(line, width)
+        if not wrapped:
+            rows.append(blank)
+            continue
+        for segment, segment_width in wrapped:
+            rows.append(f"{left}{segment}{' ' * (width - segment_width)}{right}")
+    rows.append(bottom)
+    return "\n".join(rows)
+
+class BoxRenderer:
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._blocks = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def render(self, key, text, width=60, style="single"):
+        memo_key = (key, width, style)
+        with self._lock:
+            entry = self._blocks.get(memo_key)
+            if entry is not None and entry[0] == text:
+                self._blocks.move_to_end(memo_key)
+                self.hits += 1
+                return entry[1]
+        
+        block = render_box(text, width, style)
+        with self._lock:
+            self.misses += 1
+            self._blocks[memo_key] = (text, block)
+            self._blocks.move_to_end(memo_key)
+            while len(self._blocks) > self.max_entries:
+                self._blocks.popitem(last=False)
+        return block
+
+class _TextExtractor(HTMLParser):
+    BREAKS = {"br", "p", "div", "ul", "ol", "h1", "h2", "h3", "h4"}
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == "li":
+            self.parts.append("\n• ")
+        elif tag in self.BREAKS:
+            self.parts.append("\n")
+    
+    def handle_endtag(self, tag):
+        if tag in self.BREAKS:
+            self.parts.append("\n")
+    
+    def handle_data(self, data):
+        self.parts.append(data)
+
+@lru_cache(maxsize=512)
+def html_to_text(markup):
+    if "<" not in markup:
+        return html.unescape(markup).strip()
+    parser = _TextExtractor()
+    parser.feed(markup)
+    parser.close()
+    lines = (line.strip() for line in "".join(parser.parts).splitlines())
+    return "\n".join(line for line in lines if line)
+
+def format_age(seconds):
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return "just now"
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds // size}{unit} ago"
+
+def describe_freshness(state, age):
+    if state == "fresh":
+        return f"cached {format_age(age)}"
+    if state == "stale":
+        return f"stale, cached {format_age(age)}"
+    if state == "offline":
+        return f"offline, cached {format_age(age)}"
+    return ""
+
+CURRENCY_FORMATS = {
+    "USD": "${}", "CAD": "CDN$ {}", "AUD": "A$ {}", "NZD": "NZ$ {}", "MXN": "Mex$ {}", "BRL": "R$ {}",
+    "ARS": "ARS$ {}", "CLP": "CLP$ {}", "COP": "COL$ {}", "GBP": "£{}", "EUR": "{}€", "PLN": "{}zł",
+    "CHF": "CHF {}", "NOK": "{} kr", "SEK": "{} kr", "DKK": "{} kr.", "RUB": "{} ₽", "UAH": "{}₴",
+    "KZT": "{}₸", "TRY": "₺{}", "INR": "₹ {}", "JPY": "¥ {}", "CNY": "¥ {}", "KRW": "₩ {}",
+    "TWD": "NT$ {}", "HKD": "HK$ {}", "SGD": "S${}", "IDR": "Rp {}", "VND": "{}₫", "ZAR": "R {}"
+}
+ZERO_DECIMAL_CURRENCIES = {"JPY", "KRW", "IDR", "VND", "CLP", "COP", "KZT", "TWD", "INR", "UAH"}
+
+def format_price(cents, currency=None):
+    if not cents:
+        return "Free"
+    currency = currency or "USD"
+    amount = cents / 100
+    text = f"{amount:,.0f}" if currency in ZERO_DECIMAL_CURRENCIES else f"{amount:,.2f}"
+    return CURRENCY_FORMATS.get(currency, "{} " + currency).format(text)
+
+def render_table(headers, rows):
+    widths = [text_width(header) for header in headers]
+    for row in rows:
+        widths = [max(width, text_width(cell)) for width, cell in zip(widths, row)]
+    
+    def line(cells):
+        return "  ".join(cell + " " * (width - text_width(cell)) for cell, width in zip(cells, widths)).rstrip()
+    
+    return "\n".join([line(headers), "  ".join("─" * width for width in widths)] + [line(row) for row in rows])
\ No newline at end of file
@@ -1,245 +1,38 @@
 import customtkinter as ctk
-import requests
-import json
-import webbrowser
 import time
-import threading
-import tkinter as tk
-from datetime import datetime
-import hashlib
-import platform
-import uuid
+from tkinter import filedialog
+from steam_animation import Animator
+from steam_cache import normalize_query
+from steam_catalog import CatalogIndex
+from steam_core import SteamService
+from steam_images import ImageLoader
+from steam_layout import BoxRenderer, describe_freshness, format_price, render_box
+from steam_metrics import StallDetector, metrics
+from steam_models import GameRecord
+from steam_prefetch import DetailsPrefetcher
+from steam_regions import REGIONS, RegionPrices
+from steam_results import PLATFORMS, ResultFilter, ResultSet
+from steam_widgets import VirtualList
+from steam_scheduler import RequestScheduler
+from steam_sync import BackgroundSync
+from steam_watchlist import PriceTracker, Watchlist
 
-class AboutWindow:
-    def __init__(self, parent):
-        self.popup = ctk.CTkToplevel(parent)
-        self.popup.title("About Crymson")
-        self.popup.geometry("500x600")
-        self.popup.transient(parent)
-        self.popup.grab_set()
-        
-        self.colors = {
-            "crimson": "#DC143C",
-            "dark_grey": "#1A1A1A",
-            "light_grey": "#2D2D2D",
-            "text_grey": "#E6E6E6",
-            "accent": "#FF1F4D"
-        }
-        
-        self.popup.configure(fg_color=self.colors["dark_grey"])
-        
-        logo_frame = ctk.CTkFrame(self.popup, fg_color=self.colors["dark_grey"])
-        logo_frame.pack(fill="x", pady=(20, 0))
-        
-        title_label = ctk.CTkLabel(
-            logo_frame,
-            text="CRYMSON",
-            font=("Segoe UI", 32, "bold"),
-            text_color=self.colors["accent"]
-        )
-        title_label.pack(pady=(0, 5))
-        
-        version_label = ctk.CTkLabel(
-            logo_frame,
-            text=f"Version 1.1.0 ({platform.system()} Build)",
-            font=("Segoe UI", 12),
-            text_color=self.colors["text_grey"]
-        )
-        version_label.pack(pady=(0, 20))
-        
-        current_year = datetime.now().year
-        copyright_text = f"""
-© {current_year} Crymson Steam Browser
-All Rights Reserved
-
-SOFTWARE LICENSE AGREEMENT
-
-This software is protected under international
-copyright laws and treaties. This software is
-licensed, not sold. 
-
-TERMS OF USE:
-1. You may not modify, decompile, or reverse
-   engineer this software.
-2. You may not redistribute this software.
-3. You may not use this software for any
-   illegal purposes.
-
-This application is not affiliated with, endorsed by,
-or sponsored by Valve Corporation. Steam and the
-Steam logo are trademarks of Valve Corporation.
-
-This software uses the following open-source components:
-- CustomTkinter (MIT License)
-- Requests (Apache 2.0 License)
-
-Created with ♥ by the Crymson Team
-Build ID: {hashlib.sha256(str(uuid.getnode()).encode()).hexdigest()[:8]}
-        """
-        
-        copyright_box = ctk.CTkTextbox(
-            self.popup,
-            width=400,
-            height=350,
-            font=("Segoe UI", 12),
-            fg_color=self.colors["light_grey"],
-            text_color=self.colors["text_grey"],
-            border_width=1,
-            border_color=self.colors["accent"]
-        )
-        copyright_box.pack(padx=20, pady=10)
-        copyright_box.insert("1.0", copyright_text)
-        copyright_box.configure(state="disabled")
-        
-        close_btn = ctk.CTkButton(
-            self.popup,
-            text="Close",
-            command=self.popup.destroy,
-            fg_color=self.colors["accent"],
-            hover_color="#FF0F3D",
-            font=("Segoe UI", 12, "bold"),
-            height=35,
-            corner_radius=10
-        )
-        close_btn.pack(pady=20)
-
-class GameInfoPopup:
-    def __init__(self, parent, game_data, details_data):
-        self.popup = ctk.CTkToplevel(parent)
-        self.popup.title(game_data["name"])
-        self.popup.geometry("900x700")
-        self.popup.transient(parent)
-        self.popup.grab_set()
-        
-        self.colors = {
-            "crimson": "#DC143C",
-            "dark_grey": "#1A1A1A",
-            "light_grey": "#2D2D2D",
-            "text_grey": "#E6E6E6",
-            "accent": "#FF1F4D"
-        }
-        
-        self.popup.configure(fg_color=self.colors["dark_grey"])
-        
-        self.main_container = ctk.CTkScrollableFrame(self.popup)
-        self.main_container.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        self.title_label = ctk.CTkLabel(
-            self.main_container,
-            text=game_data["name"],
-            font=("Segoe UI", 28, "bold"),
-            text_color=self.colors["accent"]
-        )
-        self.title_label.pack(pady=(0, 20))
-        
-        header_url = details_data.get("header_image", "")
-        if header_url:
-            html_frame = tk.Frame(self.main_container, bg=self.colors["dark_grey"])
-            html_frame.pack(fill="x", pady=(0, 20))
-            
-            webview = tk.Label(
-                html_frame,
-                text="[Game Image]",
-                bg=self.colors["dark_grey"],
-                fg=self.colors["text_grey"]
-            )
-            webview.pack(pady=10)
-            
-            view_image_btn = ctk.CTkButton(
-                html_frame,
-                text="View Full Size Image",
-                command=lambda: webbrowser.open(header_url),
-                fg_color=self.colors["accent"],
-                hover_color="#FF0F3D"
-            )
-            view_image_btn.pack(pady=(0, 10))
-        
-        self.create_info_section("About", details_data.get("short_description", "No description available."))
-        
-        price = game_data.get("price", {}).get("final", 0) / 100
-        price_text = f"${price:.2f}" if price > 0 else "Free"
-        release_date = details_data.get("release_date", {}).get("date", "N/A")
-        self.create_info_section("Release & Price", f"Price: {price_text}\nRelease Date: {release_date}")
-        
-        dev_pub_info = (
-            f"Developers: {', '.join(details_data.get('developers', ['N/A']))}\n"
-            f"Publishers: {', '.join(details_data.get('publishers', ['N/A']))}"
-        )
-        self.create_info_section("Development", dev_pub_info)
-        
-        screenshots = details_data.get("screenshots", [])
-        if screenshots:
-            self.create_section_title("Screenshots")
-            screenshots_frame = ctk.CTkFrame(self.main_container)
-            screenshots_frame.pack(fill="x", pady=(0, 20))
-            
-            for i, screenshot in enumerate(screenshots[:4]):
-                screenshot_label = ctk.CTkLabel(
-                    screenshots_frame,
-                    text=f"[Screenshot {i+1}]",
-                    text_color=self.colors["text_grey"]
-                )
-                screenshot_label.pack(pady=5)
-                
-                view_btn = ctk.CTkButton(
-                    screenshots_frame,
-                    text=f"View Screenshot {i+1}",
-                    command=lambda url=screenshot["path"]: webbrowser.open(url),
-                    fg_color=self.colors["accent"],
-                    hover_color="#FF0F3D"
-                )
-                view_btn.pack(pady=(0, 10))
-        
-        categories = ", ".join(cat["description"] for cat in details_data.get("categories", []))
-        genres = ", ".join(genre["description"] for genre in details_data.get("genres", []))
-        self.create_info_section("Categories & Genres", f"Categories:\n{categories}\n\nGenres:\n{genres}")
-        
-        if "pc_requirements" in details_data:
-            req_text = details_data["pc_requirements"].get("minimum", "Not specified")
-            self.create_info_section("System Requirements", req_text)
-        
-        buttons_frame = ctk.CTkFrame(self.main_container)
-        buttons_frame.pack(fill="x", pady=(20, 0))
-        
-        store_btn = ctk.CTkButton(
-            buttons_frame,
-            text="View on Steam",
-            command=lambda: webbrowser.open(f"https://store.steampowered.com/app/{game_data['id']}"),
-            fg_color=self.colors["accent"],
-            hover_color="#FF0F3D"
-        )
-        store_btn.pack(side="left", padx=5)
-        
-        close_btn = ctk.CTkButton(
-            buttons_frame,
-            text="Close",
-            command=self.popup.destroy,
-            fg_color=self.colors["light_grey"],
-            hover_color="#303030"
-        )
-        close_btn.pack(side="right", padx=5)
-    
-    def create_section_title(self, title):
-        title_label = ctk.CTkLabel(
-            self.main_container,
-            text=title,
-            font=("Segoe UI", 18, "bold"),
-            text_color=self.colors["accent"]
-        )
-        title_label.pack(pady=(20, 5), anchor="w")
-    
-    def create_info_section(self, title, content):
-        self.create_section_title(title)
-        
-        content_box = ctk.CTkTextbox(
-            self.main_container,
-            height=100,
-            wrap="word",
-            font=("Segoe UI", 12)
-        )
-        content_box.pack(fill="x", pady=(0, 10))
-        content_box.insert("1.0", content)
-        content_box.configure(state="disabled")
+PRICE_RANGES = {
+    "Any price": (None, None),
+    "Free": (0, 0),
+    "Under 5": (1, 499),
+    "Under 10": (1, 999),
+    "Under 20": (1, 1999),
+    "20 and up": (2000, None)
+}
+SORT_ORDERS = {
+    "Store order": (None, False),
+    "Price: low to high": ("price", False),
+    "Price: high to low": ("price", True),
+    "Metascore": ("metascore", True),
+    "Newest": ("year", True),
+    "Name": ("name", False)
+}
 
 class SteamLookup:
     def __init__(self):
@@ -262,9 +55,50 @@ class SteamLookup:
         self.items_per_page = 50
         self.total_results = 0
         self.current_games = []
-        self.transition_active = False
+        self.animator = Animator(self.app)
+        self.service = SteamService()
+        self.client = self.service.client
+        self.prefetcher = DetailsPrefetcher(self.service)
+        self.sync = BackgroundSync(self.service)
+        self.region_prices = RegionPrices(self.service)
+        self.watchlist = Watchlist()
+        self.price_tracker = PriceTracker(self.client, self.watchlist)
+        self.price_drops = self.watchlist.drops(self.service.cc)
+        self.watchlist_max_age = 3600
+        self.showing_watchlist = False
+        self.current_game = None
+        self.results = ResultSet()
+        self.results_scope = None
+        self.result_filter = ResultFilter()
+        self._enrich_job = None
+        self._facets_job = None
+        self.popups = None
+        self.catalog = CatalogIndex()
+        self.catalog_size = self.catalog.count()
+        self.incremental_search = True
+        self.search_delay_ms = 250
+        self.min_query_length = 3
+        self._search_job = None
+        self._typed_query = ""
+        self.status_message = ""
+        self.box_renderer = BoxRenderer()
+        self.box_width = 60
+        self.current_detail = None
+        self._resize_job = None
+        self.scheduler = RequestScheduler(self.app, on_busy=self.set_busy)
+        self.images = ImageLoader(self.client, self.scheduler.call_soon)
+        self.stall_detector = StallDetector(self.app, metrics)
+        self.hud_label = None
+        self._hud_job = None
+        self.current_results = None
+        self.showing_snapshot = False
+        self.freshness_note = ""
+        self.service.details_cache.on_store = self._on_details_cached
+        self.register_metrics()
         
         self.setup_gui()
+        self.restore_session()
+        self.sync.start()
     
     def setup_gui(self):
         self.app.configure(fg_color=self.colors["dark_grey"])
@@ -290,6 +124,70 @@ class SteamLookup:
         )
         about_button.pack(side="right", padx=5)
         
+        self.animations_button = ctk.CTkButton(
+            menu_frame,
+            text="Animations: On",
+            width=120,
+            command=self.toggle_animations,
+            fg_color=self.colors["light_grey"],
+            hover_color="#303030"
+        )
+        self.animations_button.pack(side="right", padx=5)
+        
+        catalog_button = ctk.CTkButton(
+            menu_frame,
+            text="Import Catalog",
+            width=120,
+            command=self.import_catalog,
+            fg_color=self.colors["light_grey"],
+            hover_color="#303030"
+        )
+        catalog_button.pack(side="right", padx=5)
+        
+        watchlist_button = ctk.CTkButton(
+            menu_frame,
+            text="Watchlist",
+            width=100,
+            command=self.show_watchlist,
+            fg_color=self.colors["light_grey"],
+            hover_color="#303030"
+        )
+        watchlist_button.pack(side="right", padx=5)
+        
+        regions = list(REGIONS) if self.service.cc in REGIONS else [self.service.cc, *REGIONS]
+        self.region_menu = ctk.CTkOptionMenu(
+            menu_frame,
+            values=regions,
+            width=80,
+            command=self.set_region,
+            fg_color=self.colors["light_grey"],
+            button_color=self.colors["light_grey"],
+            button_hover_color="#303030"
+        )
+        self.region_menu.set(self.service.cc)
+        self.region_menu.pack(side="right", padx=5)
+        
+        self.hud_button = ctk.CTkButton(
+            menu_frame,
+            text="HUD: Off",
+            width=80,
+            command=self.toggle_hud,
+            fg_color=self.colors["light_grey"],
+            hover_color="#303030"
+        )
+        self.hud_button.pack(side="right", padx=5)
+        
+        export_button = ctk.CTkButton(
+            menu_frame,
+            text="Export Metrics",
+            width=120,
+            command=self.export_metrics,
+            fg_color=self.colors["light_grey"],
+            hover_color="#303030"
+        )
+        export_button.pack(side="right", padx=5)
+        self.app.bind("<F12>", lambda e: self.toggle_hud())
+        
         self.main_container = ctk.CTkFrame(self.app)
         self.main_container.pack(fill="both", expand=True, padx=10, pady=10)
         
@@ -301,17 +199,56 @@ class SteamLookup:
                                        width=400)
         self.search_entry.pack(side="left", padx=5)
         self.search_entry.bind("<Return>", lambda e: self.search_game())
+        self.search_entry.bind("<KeyRelease>", self.on_search_key)
         
         self.search_button = ctk.CTkButton(self.search_frame, 
                                          text="Search",
                                          command=self.search_game)
         self.search_button.pack(side="left", padx=5)
         
+        self.filter_frame = ctk.CTkFrame(self.main_container)
+        self.filter_frame.pack(fill="x", padx=10, pady=(0, 5))
+        
+        menu_style = {
+            "width": 150,
+            "fg_color": self.colors["light_grey"],
+            "button_color": self.colors["light_grey"],
+            "button_hover_color": "#303030"
+        }
+        self.price_filter = ctk.CTkOptionMenu(self.filter_frame, values=list(PRICE_RANGES),
+                                              command=self.on_filter_change, **menu_style)
+        self.genre_filter = ctk.CTkOptionMenu(self.filter_frame, values=["Any genre"],
+                                              command=self.on_filter_change, **menu_style)
+        self.platform_filter = ctk.CTkOptionMenu(self.filter_frame, values=["Any platform"],
+                                                 command=self.on_filter_change, **menu_style)
+        self.year_filter = ctk.CTkOptionMenu(self.filter_frame, values=["Any year"],
+                                             command=self.on_filter_change, **menu_style)
+        self.sort_menu = ctk.CTkOptionMenu(self.filter_frame, values=list(SORT_ORDERS),
+                                           command=self.on_filter_change, **menu_style)
+        for menu in (self.price_filter, self.genre_filter, self.platform_filter, self.year_filter, self.sort_menu):
+            menu.pack(side="left", padx=5, pady=5)
+        
+        clear_button = ctk.CTkButton(
+            self.filter_frame,
+            text="Clear",
+            width=60,
+            command=self.clear_filters,
+            fg_color=self.colors["light_grey"],
+            hover_color="#303030"
+        )
+        clear_button.pack(side="left", padx=5)
+        
+        self.filter_label = ctk.CTkLabel(self.filter_frame, text="", font=("Segoe UI", 12))
+        self.filter_label.pack(side="right", padx=10)
+        
         self.results_container = ctk.CTkFrame(self.main_container)
         self.results_container.pack(fill="both", expand=True, padx=10, pady=10)
         
-        self.games_frame = ctk.CTkScrollableFrame(self.results_container, width=300)
-        self.games_frame.pack(side="left", fill="y", padx=5)
+        self.games_list = VirtualList(self.results_container,
+                                      create_row=self.create_game_row,
+                                      bind_row=self.bind_game_row,
+                                      width=300)
+        self.games_list.pack(side="left", fill="y", padx=5)
         
         self.details_frame = ctk.CTkFrame(self.results_container)
         self.details_frame.pack(side="left", fill="both", expand=True, padx=5)
@@ -334,6 +271,8 @@ class SteamLookup:
                                          height=500,
                                          font=("Segoe UI", 12))
         self.game_details.pack(fill="both", expand=True, padx=10, pady=5)
+        self.details_font = ctk.CTkFont(family="Segoe UI", size=12)
+        self.game_details.bind("<Configure>", self._on_details_resize)
         
         self.buttons_frame = ctk.CTkFrame(self.details_frame)
         self.buttons_frame.pack(fill="x", padx=10, pady=5)
@@ -344,6 +283,18 @@ class SteamLookup:
         self.store_button.pack(side="left", padx=5)
         self.store_button.pack_forget()
         
+        self.watch_button = ctk.CTkButton(self.buttons_frame,
+                                        text="Watch Price",
+                                        command=self.toggle_watch)
+        self.watch_button.pack(side="left", padx=5)
+        self.watch_button.pack_forget()
+        
+        self.compare_button = ctk.CTkButton(self.buttons_frame,
+                                          text="Compare Regions",
+                                          command=self.compare_game_regions)
+        self.compare_button.pack(side="left", padx=5)
+        self.compare_button.pack_forget()
+        
         self.nav_frame = ctk.CTkFrame(self.main_container)
         self.nav_frame.pack(fill="x", padx=10, pady=10)
         
@@ -362,6 +313,16 @@ class SteamLookup:
                                        command=self.next_page)
         self.next_button.pack(side="left", padx=5)
         
+        self.compare_page_button = ctk.CTkButton(self.nav_frame,
+                                               text="Compare Page Prices",
+                                               command=self.compare_page_regions)
+        self.compare_page_button.pack(side="left", padx=5)
+        
+        self.status_label = ctk.CTkLabel(self.nav_frame,
+                                       text="",
+                                       font=("Segoe UI", 12))
+        self.status_label.pack(side="right", padx=10)
+        
         self.theme_button = ctk.CTkButton(self.main_container,
                                         text="Toggle Theme",
                                         command=self.toggle_theme)
@@ -371,6 +332,7 @@ class SteamLookup:
         
         self.game_title.configure(text_color=self.colors["accent"])
         self.app_id_label.configure(text_color=self.colors["text_grey"])
+        self.status_label.configure(text_color=self.colors["text_grey"])
         self.game_details.configure(fg_color=self.colors["light_grey"],
                                   text_color=self.colors["text_grey"])
         
@@ -382,233 +344,543 @@ class SteamLookup:
         
         self.search_button.configure(**button_style)
         self.store_button.configure(**button_style)
+        self.watch_button.configure(**button_style)
+        self.compare_button.configure(**button_style)
+        self.compare_page_button.configure(**button_style)
         self.prev_button.configure(**button_style)
         self.next_button.configure(**button_style)
         self.theme_button.configure(**button_style)
-        
-        self.search_game()
+    
+    def restore_session(self):
+        snapshot = self.service.load_snapshot()
+        if snapshot is not None:
+            query, page, data, saved_at = snapshot
+            if query:
+                self.search_entry.insert(0, query)
+                self._typed_query = query.strip()
+            self.current_page = page
+            self.total_results = data.total
+            self.current_games = data.items
+            self.use_results(("search", normalize_query(query)), data.items)
+            self.display_games_list()
+            self.update_navigation()
+            self.showing_snapshot = True
+            self.set_status(f"Last session ({time.strftime('%d %b %H:%M', time.localtime(saved_at))}), refreshing...")
+        self.app.after_idle(self.fetch_games)
     
     def fade_text(self, widget, new_text):
+        color = self.colors["accent"] if widget is self.game_title else self.colors["text_grey"]
+        with metrics.span("ui.fade_text"):
+            self.animator.fade_content(widget, lambda: self.set_widget_text(widget, new_text), color)
+    
+    def set_widget_text(self, widget, new_text):
         if isinstance(widget, ctk.CTkLabel):
-            for alpha in range(100, 0, -10):
-                widget.configure(text_color=f"gray{alpha}")
-                self.app.update()
-                time.sleep(0.01)
-            
             widget.configure(text=new_text)
-            
-            for alpha in range(0, 100, 10):
-                widget.configure(text_color=f"gray{alpha}")
-                self.app.update()
-                time.sleep(0.01)
         else:
             widget.configure(state="normal")
-            for alpha in range(100, 0, -10):
-                widget.configure(text_color=f"gray{alpha}")
-                self.app.update()
-                time.sleep(0.01)
-            
             widget.delete("1.0", "end")
             widget.insert("1.0", new_text)
-            
-            for alpha in range(0, 100, 10):
-                widget.configure(text_color=f"gray{alpha}")
-                self.app.update()
-                time.sleep(0.01)
     
     def create_ascii_box(self, text, width=60, style="single"):
-        lines = text.split('\n')
-        
-        if style == "double":
-            box_chars = {
-                "top_left": "╔", "top_right": "╗", "bottom_left": "╚", "bottom_right": "╝",
-                "horizontal": "═", "vertical": "║"
-            }
-        else:
-            box_chars = {
-                "top_left": "┌", "top_right": "┐", "bottom_left": "└", "bottom_right": "┘",
-                "horizontal": "─", "vertical": "│"
-            }
-        
-        box_top = (f"{box_chars['top_left']}"
-                  f"{box_chars['horizontal'] * (width + 2)}"
-                  f"{box_chars['top_right']}")
-        
-        box_bottom = (f"{box_chars['bottom_left']}"
-                     f"{box_chars['horizontal'] * (width + 2)}"
-                     f"{box_chars['bottom_right']}")
-        
-        box_content = []
-        for line in lines:
-            if line.strip():
-                while len(line) > width:
-                    split_at = line[:width].rfind(' ')
-                    if split_at == -1:
-                        split_at = width
-                    box_content.append(f"{box_chars['vertical']} {line[:split_at].ljust(width)} {box_chars['vertical']}")
-                    line = line[split_at:].strip()
-                box_content.append(f"{box_chars['vertical']} {line.ljust(width)} {box_chars['vertical']}")
-            else:
-                box_content.append(f"{box_chars['vertical']} {' ' * width} {box_chars['vertical']}")
-        
-        return "\n".join([box_top] + box_content + [box_bottom])
+        with metrics.span("layout.ascii_box"):
+            return render_box(text, width, style)
+    
+    def render_details_text(self, game, details, width=None):
+        width = width or self.box_width
+        app_id = game.id
+        overview = details.price_overview or {}
+        price = format_price(overview.get("final", game.price_final), overview.get("currency", game.currency))
+        sections = [
+            ("price", "double", f"""
+Price: {price}
+Release Date: {details.release_date}
+"""),
+            ("development", "single", f"""
+Developers: {', '.join(details.developers)}
+Publishers: {', '.join(details.publishers)}
+"""),
+            ("description", "double", f"""
+Description:
+{details.short_description}
+"""),
+            ("categories", "single", f"""
+Categories:
+{', '.join(details.categories)}
+"""),
+            ("genres", "double", f"""
+Genres:
+{', '.join(details.genres)}
+"""),
+            ("tags", "single", f"""
+Tags:
+{', '.join(details.categories[:5])}
+""")
+        ]
+        with metrics.span("layout.details", width=width):
+            return "\n\n".join(
+                self.box_renderer.render((app_id, section), text, width, style)
+                for section, style, text in sections
+            )
+    
+    def _on_details_resize(self, event):
+        if self._resize_job is not None:
+            self.app.after_cancel(self._resize_job)
+        self._resize_job = self.app.after(100, self._apply_details_width, event.width)
+    
+    def _apply_details_width(self, pixel_width):
+        self._resize_job = None
+        char_px = max(1, self.details_font.measure("0"))
+        width = max(30, pixel_width // char_px - 6)
+        if width == self.box_width:
+            return
+        self.box_width = width
+        if self.current_detail is not None and not self.animator.is_running((str(self.game_details), "fade")):
+            self.set_widget_text(self.game_details, self.render_details_text(*self.current_detail))
     
     def search_game(self):
         self.current_page = 1
         self.fetch_games()
     
-    def fetch_games(self):
-        query = self.search_entry.get()
+    def on_search_key(self, event):
+        query = self.search_entry.get().strip()
+        if event.keysym in ("Return", "KP_Enter") or query == self._typed_query:
+            return
+        self._typed_query = query
+        if self._search_job is not None:
+            self.app.after_cancel(self._search_job)
+        self._search_job = self.app.after(self.search_delay_ms, self.search_incremental)
+    
+    def search_incremental(self):
+        self._search_job = None
+        query = self.search_entry.get().strip()
+        if self.catalog_size:
+            if query:
+                self.search_local(query)
+        elif not self.incremental_search:
+            return
+        elif len(query) >= self.min_query_length:
+            self.current_page = 1
+            self.fetch_games(query, incremental=True)
+        else:
+            self.scheduler.cancel("search")
+    
+    def search_local(self, query):
+        results = [GameRecord(game["id"], game["name"]) for game in self.catalog.search(query, self.items_per_page)]
         
-        for widget in self.games_frame.winfo_children():
-            widget.destroy()
+        self.scheduler.cancel("search")
+        self.showing_watchlist = False
+        self.current_page = 1
+        self.current_games = results
+        self.total_results = len(results)
+        self.use_results(("local", normalize_query(query)), results)
+        self.display_games_list()
         
-        try:
-            search_url = "https://store.steampowered.com/api/storesearch"
-            params = {
-                "term": query,
-                "l": "english",
-                "cc": "US",
-                "page": self.current_page,
-                "count": self.items_per_page
-            }
-            
-            response = requests.get(search_url, params=params)
-            data = response.json()
-            
-            self.total_results = data.get("total", 0)
-            self.current_games = data.get("items", [])
-            
-            if self.current_games:
-                self.display_games_list()
-                self.update_navigation()
-            else:
-                self.display_error("No games found!")
-        except Exception as e:
-            self.display_error(f"Error: {str(e)}")
+        self.page_label.configure(text=f"Local catalog: {len(results)} matches")
+        self.prev_button.configure(state="disabled")
+        self.next_button.configure(state="disabled")
+        
+        if not results or len(query) < self.min_query_length:
+            return
+        cached = self.service.cached_search(query) or self.service.prefix_search(query, min_length=self.min_query_length)
+        if cached is not None:
+            self.scheduler.cancel("enrich")
+            self._enrich_prices(results, cached)
+            return
+        self.scheduler.submit(
+            self.service.search, query,
+            on_done=lambda data: self._enrich_prices(results, data),
+            channel="enrich"
+        )
     
-    def display_games_list(self):
-        for game in self.current_games:
-            game_frame = ctk.CTkFrame(self.games_frame)
-            game_frame.pack(fill="x", padx=5, pady=2)
-            
-            name = game.get("name", "Unknown Game")
-            price = game.get("price", {}).get("final", 0) / 100
-            price_text = f"${price:.2f}" if price > 0 else "Free"
-            
-            button_frame = ctk.CTkFrame(game_frame)
-            button_frame.pack(fill="x", padx=5, pady=2)
-            
-            game_button = ctk.CTkButton(
-                button_frame,
-                text=f"{name} - {price_text}",
-                command=lambda g=game: self.show_game_details(g),
-                fg_color=self.colors["accent"],
-                hover_color="#FF0F3D"
-            )
-            game_button.pack(side="left", fill="x", expand=True, padx=(0, 5))
-            
-            info_button = ctk.CTkButton(
-                button_frame,
-                text="ℹ",
-                width=30,
-                command=lambda g=game: self.show_game_popup(g),
-                fg_color=self.colors["light_grey"],
-                hover_color="#303030"
-            )
-            info_button.pack(side="right")
+    def _enrich_prices(self, games, data):
+        records = {item.id: item for item in data.items}
+        for game in games:
+            record = records.get(game.id)
+            if record is not None:
+                game.price_final = record.price_final
+                game.price_initial = record.price_initial
+                game.currency = record.currency
+        if games is not self.current_games:
+            return
+        self.results.add(games)
+        if self.result_filter.active:
+            self.display_games_list()
+        else:
+            self.games_list.refresh(rebind=True)
     
-    def show_game_details(self, game):
-        if self.transition_active:
+    def import_catalog(self):
+        path = filedialog.askopenfilename(
+            title="Import Steam app list",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
             return
         
-        self.transition_active = True
-        threading.Thread(target=self._show_game_details_with_transition, args=(game,)).start()
+        self.set_status("Importing catalog...")
+        self.scheduler.submit(
+            self.catalog.import_file, path,
+            on_done=self._on_catalog_imported,
+            on_error=lambda e: self.display_error(f"Catalog import failed: {str(e)}")
+        )
+    
+    def _on_catalog_imported(self, count):
+        self.catalog_size = count
+        self.set_status(f"Catalog: {count} apps")
     
-    def _show_game_details_with_transition(self, game):
-        self.app.after(0, lambda: self.fade_text(self.game_title, game["name"]))
-        self.app.after(0, lambda: self.fade_text(self.app_id_label, f"App ID: {game['id']}"))
+    def fetch_games(self, query=None, incremental=False):
+        if query is None:
+            query = self.search_entry.get()
+        page = self.current_page
+        
+        total = self.service.cached_total(query, self.items_per_page)
+        if total is not None:
+            self.total_results = total
+            self.update_navigation()
+        
+        cached = self.service.cached_search(query, page, self.items_per_page)
+        if cached is None and incremental and page == 1:
+            cached = self.service.prefix_search(query, self.items_per_page, min_length=self.min_query_length)
+        if cached is not None:
+            self.scheduler.cancel("search")
+            self._on_games_loaded(cached, query, page)
+            return
         
-        try:
-            app_id = game['id']
-            details_url = f"https://store.steampowered.com/api/appdetails"
-            params = {
-                "appids": app_id,
-                "cc": "US",
-                "l": "english"
-            }
-            response = requests.get(details_url, params=params)
-            details = response.json()[str(app_id)]['data']
-            
-            price_box = self.create_ascii_box(f"""
-Price: ${game.get('price', {}).get('final', 0)/100:.2f}
-Release Date: {details.get('release_date', {}).get('date', 'N/A')}
-""", style="double")
-            
-            dev_box = self.create_ascii_box(f"""
-Developers: {', '.join(details.get('developers', ['N/A']))}
-Publishers: {', '.join(details.get('publishers', ['N/A']))}
-""")
-            
-            desc_box = self.create_ascii_box(f"""
-Description:
-{details.get('short_description', 'No description available.')}
-""", style="double")
-            
-            categories_box = self.create_ascii_box(f"""
-Categories:
-{', '.join(cat['description'] for cat in details.get('categories', []))}
-""")
-            
-            genres_box = self.create_ascii_box(f"""
-Genres:
-{', '.join(genre['description'] for genre in details.get('genres', []))}
-""", style="double")
-            
-            tags_box = self.create_ascii_box(f"""
-Tags:
-{', '.join(tag['description'] for tag in details.get('categories', [])[:5])}
-""")
-            
-            info_text = "\n\n".join([
-                price_box,
-                dev_box,
-                desc_box,
-                categories_box,
-                genres_box,
-                tags_box
-            ])
-            
-            self.app.after(0, lambda: self.fade_text(self.game_details, info_text))
-            
-        except Exception as e:
-            info_text = self.create_ascii_box(f"""
-App ID: {game['id']}
-Price: ${game.get('price', {}).get('final', 0)/100:.2f}
-Release Date: {game.get('release_date', {}).get('date', 'N/A')}
-""", style="double")
-            self.app.after(0, lambda: self.fade_text(self.game_details, info_text))
+        on_refresh = lambda data: self.scheduler.call_soon(self._on_page_refreshed, data, query, page)
+        self.scheduler.submit(
+            self.service.search_entry, query, page, self.items_per_page, None, None, on_refresh,
+            on_done=lambda entry: self._on_games_loaded(entry[0], query, page, describe_freshness(entry[2], entry[1])),
+            on_error=lambda e: self.display_error(f"{'Offline' if self.service.offline else 'Error'}: {str(e)}"),
+            channel="search"
+        )
+    
+    def _on_page_refreshed(self, data, query, page):
+        if self.showing_watchlist or self.results_scope != ("search", normalize_query(query)):
+            return
+        if self.current_results is not None and self.current_results[:2] == (query, page):
+            self._on_games_loaded(data, query, page)
+    
+    def _on_games_loaded(self, data, query, page, freshness=""):
+        self.total_results = data.total
+        self.current_games = data.items
+        self.current_results = (query, page, data)
+        self.showing_watchlist = False
+        self.use_results(("search", normalize_query(query)), data.items)
+        if self.showing_snapshot or freshness != self.freshness_note:
+            self.showing_snapshot = False
+            self.freshness_note = freshness
+            self.set_status(f"Results {freshness}" if freshness else "")
+        
+        self.display_games_list()
+        if self.current_games:
+            self.update_navigation()
+            self.prefetcher.prefetch_page([game.id for game in self.current_games], self.service.cc, self.service.l)
+            self.prefetch_adjacent_pages(query, page)
+        else:
+            self.display_error("No games found!")
+    
+    def prefetch_adjacent_pages(self, query, page):
+        total_pages = (self.total_results + self.items_per_page - 1) // self.items_per_page
+        for channel, adjacent in (("next-page", page + 1), ("prev-page", page - 1)):
+            if not 1 <= adjacent <= total_pages:
+                continue
+            if self.service.cached_search(query, adjacent, self.items_per_page) is not None:
+                continue
+            self.scheduler.submit(
+                self.service.search, query, adjacent, self.items_per_page,
+                channel=channel,
+                track=False
+            )
+    
+    def display_games_list(self):
+        items = self.current_games
+        if self.result_filter.active:
+            with metrics.span("results.query", rows=len(self.results)):
+                items = self.results.query(self.result_filter)
+        with metrics.span("ui.display_games_list", items=len(items)):
+            self.games_list.set_items(items)
+        self.update_facets()
+    
+    def use_results(self, scope, games):
+        if scope != self.results_scope:
+            self.scheduler.cancel("enrich")
+            self.results.clear()
+            self.results_scope = scope
+        self.results.add(games)
+        if self._enrich_job is None:
+            self._enrich_job = self.app.after_idle(self._enrich_results)
+    
+    def _enrich_results(self):
+        self._enrich_job = None
+        with metrics.span("results.enrich"):
+            for app_id in self.results.pending(50):
+                details = self.service.cached_details(app_id)
+                if details is None:
+                    self.results.mark_missing(app_id)
+                else:
+                    self.results.enrich(details)
+        if self.results.pending(1):
+            self._enrich_job = self.app.after_idle(self._enrich_results)
+        else:
+            self.schedule_facets()
+    
+    def _on_details_cached(self, key, details):
+        self.scheduler.call_soon(self._apply_cached_details, details)
+    
+    def _apply_cached_details(self, details):
+        if self.results.enrich(details):
+            self.schedule_facets()
+    
+    def schedule_facets(self):
+        if self._facets_job is None:
+            self._facets_job = self.app.after(300, self.update_facets)
+    
+    def update_facets(self):
+        if self._facets_job is not None:
+            self.app.after_cancel(self._facets_job)
+            self._facets_job = None
+        
+        active = self.result_filter.active
+        with metrics.span("results.facets", rows=len(self.results)):
+            facets = self.results.facets(self.results.mask(self.result_filter) if active else None)
+        self.genre_filter.configure(
+            values=["Any genre"] + [f"{name} ({count})" for name, count in sorted(facets["genres"].items())]
+        )
+        self.platform_filter.configure(
+            values=["Any platform"] + [f"{name} ({count})" for name, count in facets["platforms"].items() if count]
+        )
+        self.year_filter.configure(values=["Any year"] + [f"{year} ({count})" for year, count in facets["years"].items()])
+        
+        if active:
+            self.filter_label.configure(text=f"Showing {facets['total']} of {len(self.results)} loaded")
+        else:
+            self.filter_label.configure(text=f"{facets['free']} free, {facets['paid']} paid in {len(self.results)} loaded")
+    
+    def on_filter_change(self, value=None):
+        price_min, price_max = PRICE_RANGES[self.price_filter.get()]
+        genre = self.genre_filter.get().rsplit(" (", 1)[0]
+        platform = self.platform_filter.get().rsplit(" (", 1)[0]
+        year = self.year_filter.get().rsplit(" (", 1)[0]
+        sort, descending = SORT_ORDERS[self.sort_menu.get()]
+        
+        self.result_filter = ResultFilter(
+            price_min=price_min,
+            price_max=price_max,
+            genres=() if genre == "Any genre" else (genre,),
+            platforms=PLATFORMS.get(platform, 0),
+            year_min=int(year) if year.isdigit() else None,
+            year_max=int(year) if year.isdigit() else None,
+            sort=sort,
+            descending=descending
+        )
+        self.display_games_list()
+    
+    def clear_filters(self):
+        self.price_filter.set("Any price")
+        self.genre_filter.set("Any genre")
+        self.platform_filter.set("Any platform")
+        self.year_filter.set("Any year")
+        self.sort_menu.set("Store order")
+        self.on_filter_change()
+    
+    def create_game_row(self, parent):
+        row = ctk.CTkFrame(parent)
         
-        self.current_store_url = f"https://store.steampowered.com/app/{game['id']}"
-        self.app.after(0, self.store_button.pack, {"side": "left", "padx": 5})
-        self.transition_active = False
+        row.game_button = ctk.CTkButton(
+            row,
+            text="",
+            fg_color=self.colors["accent"],
+            hover_color="#FF0F3D"
+        )
+        row.game_button.pack(side="left", fill="x", expand=True, padx=(5, 5), pady=2)
+        
+        row.info_button = ctk.CTkButton(
+            row,
+            text="ℹ",
+            width=30,
+            fg_color=self.colors["light_grey"],
+            hover_color="#303030"
+        )
+        row.info_button.pack(side="right", padx=(0, 5), pady=2)
+        
+        row.game_button.bind("<Enter>", lambda e: row.item and self.prefetcher.prioritize(row.item.id))
+        return row
+    
+    def bind_game_row(self, row, game):
+        price_text = format_price(game.price_final, game.currency)
+        drop = self.price_drops.get(game.id)
+        if drop is not None and drop[1] == game.price_final:
+            price_text += f" ▼ was {format_price(drop[0], game.currency)}"
+        
+        row.game_button.configure(
+            text=f"{game.name} - {price_text}" if game.price_known else game.name,
+            command=lambda: self.show_game_details(game)
+        )
+        row.info_button.configure(command=lambda: self.show_game_popup(game))
+    
+    def show_game_details(self, game):
+        self.fade_text(self.game_title, game.name)
+        self.fade_text(self.app_id_label, f"App ID: {game.id}")
+        self.scheduler.submit(
+            self.get_app_details, game.id,
+            lambda data: self.scheduler.call_soon(self._on_details_refreshed, game, data),
+            on_done=lambda entry: self._on_details_loaded(game, *entry),
+            on_error=lambda e: self._on_details_failed(game, e),
+            channel="details"
+        )
+    
+    def _on_details_loaded(self, game, details, age, state):
+        self.current_detail = (game, details)
+        freshness = describe_freshness(state, age)
+        if freshness:
+            self.fade_text(self.app_id_label, f"App ID: {game.id} ({freshness})")
+        self.fade_text(self.game_details, self.render_details_text(game, details))
+        self.select_game(game)
+    
+    def _on_details_failed(self, game, error):
+        self.current_detail = None
+        price_overview = self.service.cached_price(game.id) or {}
+        price = format_price(price_overview.get("final", game.price_final),
+                             price_overview.get("currency", game.currency))
+        info_text = self.create_ascii_box(f"""
+App ID: {game.id}
+Price: {price}
+Release Date: N/A
+Details: {'offline, not cached yet' if self.service.offline else str(error)}
+""", style="double")
+        self.fade_text(self.game_details, info_text)
+        self.select_game(game)
+    
+    def select_game(self, game):
+        self.current_store_url = f"https://store.steampowered.com/app/{game.id}"
+        self.current_game = game
+        self.store_button.pack(side="left", padx=5)
+        self.update_watch_button()
+        self.compare_button.pack(side="left", padx=5)
+    
+    def _on_details_refreshed(self, game, details):
+        if self.current_detail is None or self.current_detail[0].id != game.id:
+            return
+        self.current_detail = (game, details)
+        self.app_id_label.configure(text=f"App ID: {game.id}")
+        self.set_widget_text(self.game_details, self.render_details_text(game, details))
     
     def show_game_popup(self, game):
-        try:
-            app_id = game['id']
-            details_url = f"https://store.steampowered.com/api/appdetails"
-            params = {
-                "appids": app_id,
-                "cc": "US",
-                "l": "english"
-            }
-            response = requests.get(details_url, params=params)
-            details = response.json()[str(app_id)]['data']
-            
-            GameInfoPopup(self.app, game, details)
-            
-        except Exception as e:
-            self.display_error(f"Error loading game details: {str(e)}")
+        key = (game.id, self.service.cc, self.service.l)
+        if self.popups is not None and self.popups.reveal(key):
+            return
+        self.scheduler.submit(
+            self.get_app_details, game.id,
+            on_done=lambda entry: self.open_game_popup(key, game, entry[0], describe_freshness(entry[2], entry[1])),
+            on_error=lambda e: self.display_error(
+                f"{'Offline' if self.service.offline else 'Error'} loading game details: {str(e)}"
+            ),
+            channel="popup"
+        )
+    
+    def open_game_popup(self, key, game, details, freshness=""):
+        if self.popups is None:
+            from steam_popup import PopupManager
+            self.popups = PopupManager(self.app, self.images)
+        self.popups.open(key, game, details, freshness)
+    
+    def get_app_details(self, app_id, on_refresh=None):
+        return self.service.details_entry(app_id, on_refresh=on_refresh)
+    
+    def show_watchlist(self):
+        self.scheduler.cancel("search")
+        self.showing_watchlist = True
+        self.display_watchlist()
+        self.prev_button.configure(state="disabled")
+        self.next_button.configure(state="disabled")
+        
+        cc = self.service.cc
+        self.scheduler.submit(
+            self.price_tracker.refresh, cc, self.service.l, self.watchlist_max_age,
+            lambda checked, total: self.scheduler.call_latest(
+                "watchlist.progress", self.set_status, f"Checking prices... {checked}/{total}"
+            ),
+            on_done=self._on_watchlist_refreshed,
+            on_error=lambda e: self.set_status(f"Price refresh failed: {str(e)}"),
+            channel="watchlist"
+        )
+    
+    def display_watchlist(self):
+        games = []
+        for app_id, name, final, initial, currency, _, checked_at in self.watchlist.items(self.service.cc):
+            if checked_at is not None:
+                final, initial = final or 0, initial or final or 0
+            games.append(GameRecord(app_id, name or f"App {app_id}", final, initial, currency))
+        
+        self.current_games = games
+        self.total_results = len(games)
+        self.use_results(("watchlist",), games)
+        self.display_games_list()
+        self.page_label.configure(text=f"Watchlist: {len(games)} apps, {len(self.price_drops)} price drops")
+    
+    def _on_watchlist_refreshed(self, summary):
+        self.price_drops = self.watchlist.drops(self.service.cc)
+        message = f"Prices checked: {summary['checked']}, changed: {summary['changed']}"
+        if summary["drops"]:
+            message += f", {len(summary['drops'])} new drops"
+        if summary["failed"]:
+            message += f", {summary['failed']} not reached"
+        self.set_status(message)
+        if self.showing_watchlist:
+            self.display_watchlist()
+    
+    def toggle_watch(self):
+        game = self.current_game
+        if game is None:
+            return
+        if self.watchlist.contains(game.id):
+            self.watchlist.remove([game.id])
+            self.price_drops.pop(game.id, None)
+        else:
+            self.watchlist.add([(game.id, game.name)])
+        self.update_watch_button()
+        if self.showing_watchlist:
+            self.display_watchlist()
+    
+    def update_watch_button(self):
+        if self.current_game is None:
+            self.watch_button.pack_forget()
+            return
+        watched = self.watchlist.contains(self.current_game.id)
+        self.watch_button.configure(text="Unwatch Price" if watched else "Watch Price")
+        self.watch_button.pack(side="left", padx=5)
+    
+    def set_region(self, cc):
+        if cc == self.service.cc:
+            return
+        self.service.cc = cc
+        self.price_drops = self.watchlist.drops(cc)
+        self.current_page = 1
+        if self.showing_watchlist:
+            self.show_watchlist()
+        else:
+            self.fetch_games()
+    
+    def compare_game_regions(self):
+        if self.current_game is not None:
+            self.compare_regions([self.current_game])
+    
+    def compare_page_regions(self):
+        if self.current_games:
+            self.compare_regions(list(self.current_games))
+    
+    def compare_regions(self, games):
+        self.set_status(f"Fetching prices in {len(self.region_prices.regions)} regions...")
+        self.scheduler.submit(
+            self.region_prices.fetch, [game.id for game in games],
+            on_done=lambda prices: self.open_region_comparison(games, prices),
+            on_error=lambda e: self.set_status(f"Regional prices failed: {str(e)}"),
+            channel="regions"
+        )
+    
+    def open_region_comparison(self, games, prices):
+        from steam_compare import RegionComparisonWindow
+        self.set_status("")
+        RegionComparisonWindow(self.app, games, prices, self.region_prices.regions)
     
     def update_navigation(self):
         total_pages = (self.total_results + self.items_per_page - 1) // self.items_per_page
@@ -626,17 +898,107 @@ Release Date: {game.get('release_date', {}).get('date', 'N/A')}
         self.current_page += 1
         self.fetch_games()
     
+    def set_busy(self, in_flight):
+        self.status_label.configure(text=f"Loading... ({in_flight})" if in_flight else self.status_message)
+    
+    def set_status(self, message):
+        self.status_message = message
+        self.status_label.configure(text=message)
+    
     def display_error(self, message):
+        self.current_detail = None
+        self.current_game = None
         self.game_title.configure(text="Error")
         self.app_id_label.configure(text="")
         self.game_details.delete("1.0", "end")
         self.game_details.insert("1.0", self.create_ascii_box(message))
         self.store_button.pack_forget()
+        self.watch_button.pack_forget()
+        self.compare_button.pack_forget()
     
     def open_store_page(self):
         if self.current_store_url:
+            import webbrowser
             webbrowser.open(self.current_store_url)
     
+    def toggle_animations(self):
+        self.animator.enabled = not self.animator.enabled
+        self.animations_button.configure(
+            text=f"Animations: {'On' if self.animator.enabled else 'Off'}"
+        )
+    
+    def register_metrics(self):
+        self.service.register_metrics(metrics)
+        metrics.watch("layout.box_hits", lambda: self.box_renderer.hits)
+        metrics.watch("layout.box_misses", lambda: self.box_renderer.misses)
+        metrics.watch("ui.dispatched", lambda: self.scheduler.dispatched)
+        metrics.watch("ui.coalesced", lambda: self.scheduler.coalesced)
+        metrics.watch("images.memory_hits", lambda: self.images.memory_hits)
+        metrics.watch("images.disk_hits", lambda: self.images.disk_hits)
+        metrics.watch("images.downloads", lambda: self.images.downloads)
+        metrics.watch("popups.built", lambda: self.popups.built if self.popups else 0)
+        metrics.watch("popups.reused", lambda: self.popups.reused if self.popups else 0)
+        metrics.watch("prefetch.completed", lambda: self.prefetcher.prefetched)
+        metrics.watch("prefetch.skipped", lambda: self.prefetcher.skipped)
+        metrics.watch("sync.refreshed", lambda: self.sync.refreshed)
+        metrics.watch("watchlist.checked", lambda: self.price_tracker.checked)
+        metrics.watch("watchlist.changed", lambda: self.price_tracker.changed)
+        metrics.watch("regions.batches", lambda: self.region_prices.batches)
+        metrics.watch("regions.cached", lambda: self.region_prices.cached)
+        self.stall_detector.start()
+    
+    def toggle_hud(self):
+        if self.hud_label is None:
+            self.hud_label = ctk.CTkLabel(
+                self.app,
+                text="",
+                font=("Consolas", 11),
+                justify="left",
+                anchor="w",
+                fg_color="#000000",
+                text_color="#7CFC00",
+                corner_radius=6
+            )
+            self.hud_label.place(relx=1.0, rely=1.0, x=-12, y=-12, anchor="se")
+            self.hud_button.configure(text="HUD: On")
+            self.update_hud()
+        else:
+            if self._hud_job is not None:
+                self.app.after_cancel(self._hud_job)
+                self._hud_job = None
+            self.hud_label.destroy()
+            self.hud_label = None
+            self.hud_button.configure(text="HUD: Off")
+    
+    def update_hud(self):
+        if self.hud_label is None:
+            return
+        lines = []
+        for name, stats in sorted(metrics.summary().items()):
+            lines.append(f"{name:<24} n={stats['count']:<5} p50={stats['p50_ms']:>7.1f} p95={stats['p95_ms']:>7.1f} ms")
+        counters = [f"{name}={value}" for name, value in sorted(metrics.counters().items())]
+        lines.append("")
+        for i in range(0, len(counters), 3):
+            lines.append("  ".join(counters[i:i + 3]))
+        lines.append(f"stalls>{self.stall_detector.threshold_ms}ms: {self.stall_detector.stalls}"
+                     f" (worst {self.stall_detector.worst_ms:.0f} ms)  in flight: {self.scheduler.in_flight}")
+        self.hud_label.configure(text="\n".join(lines))
+        self._hud_job = self.app.after(500, self.update_hud)
+    
+    def export_metrics(self):
+        path = filedialog.asksaveasfilename(
+            title="Export metrics",
+            defaultextension=".json",
+            filetypes=[("Chrome trace", "*.trace.json"), ("JSON", "*.json")]
+        )
+        if not path:
+            return
+        try:
+            metrics.export(path)
+            self.set_status(f"Metrics exported to {path}")
+        except OSError as e:
+            self.display_error(f"Metrics export failed: {str(e)}")
+    
     def toggle_theme(self):
         if ctk.get_appearance_mode() == "Dark":
             ctk.set_appearance_mode("light")
@@ -644,10 +1006,25 @@ Release Date: {game.get('release_date', {}).get('date', 'N/A')}
             ctk.set_appearance_mode("dark")
     
     def show_about(self):
+        from steam_about import AboutWindow
         AboutWindow(self.app)
     
     def run(self):
-        self.app.mainloop()
+        try:
+            self.app.mainloop()
+        finally:
+            self.stall_detector.stop()
+            self.scheduler.shutdown()
+            self.prefetcher.stop()
+            self.sync.stop()
+            self.images.shutdown()
+            if self.current_results is not None:
+                self.service.save_snapshot(*self.current_results)
+            self.service.details_cache.on_store = None
+            self.service.close()
+            self.price_tracker.stop()
+            self.watchlist.close()
+            self.catalog.close()
 
 if __name__ == "__main__":
     app = SteamLookup()
@@ -0,0 +1,157 @@
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+class Metrics:
+    def __init__(self, max_spans=5000, enabled=True):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self._spans = deque(maxlen=max_spans)
+        self._counters = {}
+        self._sources = {}
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def span(self, name, **args):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter() - start, args)
+    
+    def record(self, name, start, duration, args=None):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._spans.append((name, start, duration, threading.get_ident(), args or {}))
+    
+    def count(self, name, n=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+    
+    def watch(self, name, read):
+        self._sources[name] = read
+    
+    def counters(self):
+        with self._lock:
+            values = dict(self._counters)
+        for name, read in list(self._sources.items()):
+            try:
+                values[name] = read()
+            except Exception:
+                continue
+        return values
+    
+    def summary(self):
+        with self._lock:
+            spans = list(self._spans)
+        durations = {}
+        for name, _, duration, _, _ in spans:
+            durations.setdefault(name, []).append(duration * 1000)
+        
+        result = {}
+        for name, values in durations.items():
+            values.sort()
+            result[name] = {
+                "count": len(values),
+                "total_ms": round(sum(values), 3),
+                "p50_ms": round(percentile(values, 50), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+                "max_ms": round(values[-1], 3)
+            }
+        return result
+    
+    def to_json(self):
+        with self._lock:
+            spans = list(self._spans)
+        return {
+            "counters": self.counters(),
+            "summary": self.summary(),
+            "spans": [
+                {
+                    "name": name,
+                    "start_ms": round((start - self.started) * 1000, 3),
+                    "duration_ms": round(duration * 1000, 3),
+                    "thread": thread,
+                    "args": args
+                }
+                for name, start, duration, thread, args in spans
+            ]
+        }
+    
+    def to_chrome_trace(self):
+        with self._lock:
+            spans = list(self._spans)
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round((start - self.started) * 1e6, 1),
+                "dur": round(duration * 1e6, 1),
+                "pid": pid,
+                "tid": thread,
+                "args": args
+            }
+            for name, start, duration, thread, args in spans
+        ]
+        now = round((time.perf_counter() - self.started) * 1e6, 1)
+        for name, value in sorted(self.counters().items()):
+            events.append({"name": name, "ph": "C", "ts": now, "pid": pid, "args": {"value": value}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+    
+    def export(self, path):
+        data = self.to_chrome_trace() if path.endswith(".trace.json") else self.to_json()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    index = max(0, math.ceil(pct / 100 * len(values)) - 1)
+    return values[min(index, len(values) - 1)]
+
+class StallDetector:
+    def __init__(self, app, metrics, threshold_ms=100, interval_ms=50):
+        self.app = app
+        self.metrics = metrics
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.stalls = 0
+        self.worst_ms = 0.0
+        self._expected = None
+        self._job = None
+    
+    def start(self):
+        if self._job is None:
+            self._expected = time.perf_counter() + self.interval_ms / 1000
+            self._job = self.app.after(self.interval_ms, self._beat)
+    
+    def stop(self):
+        if self._job is not None:
+            try:
+                self.app.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+    
+    def _beat(self):
+        now = time.perf_counter()
+        late_ms = (now - self._expected) * 1000
+        if late_ms >= self.threshold_ms:
+            self.stalls += 1
+            self.worst_ms = max(self.worst_ms, late_ms)
+            self.metrics.count("ui.stalls")
+            self.metrics.record("ui.stall", self._expected, now - self._expected, {"blocked_ms": round(late_ms, 1)})
+        self._expected = now + self.interval_ms / 1000
+        self._job = self.app.after(self.interval_ms, self._beat)
+
+metrics = Metrics()
\ No newline at end of file
@@ -0,0 +1,137 @@
+from steam_layout import html_to_text
+
+DETAIL_FILTERS = "basic,price_overview,release_date,developers,publishers,categories,genres,screenshots,pc_requirements,platforms,metacritic"
+
+PLATFORM_WINDOWS = 1
+PLATFORM_MAC = 2
+PLATFORM_LINUX = 4
+
+def platform_flags(platforms):
+    platforms = platforms or {}
+    return (
+        (PLATFORM_WINDOWS if platforms.get("windows") else 0)
+        | (PLATFORM_MAC if platforms.get("mac") else 0)
+        | (PLATFORM_LINUX if platforms.get("linux") else 0)
+    )
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+class GameRecord:
+    __slots__ = ("id", "name", "price_final", "price_initial", "currency",
+                 "metascore", "platforms", "tiny_image")
+    
+    def __init__(self, id, name, price_final=None, price_initial=None, currency=None,
+                 metascore=None, platforms=0, tiny_image=None):
+        self.id = id
+        self.name = name
+        self.price_final = price_final
+        self.price_initial = price_initial
+        self.currency = currency
+        self.metascore = metascore
+        self.platforms = platforms
+        self.tiny_image = tiny_image
+    
+    @classmethod
+    def from_search(cls, item):
+        price = item.get("price") or {}
+        return cls(
+            int(item["id"]),
+            item.get("name", "Unknown Game"),
+            price.get("final", 0),
+            price.get("initial", price.get("final", 0)),
+            price.get("currency"),
+            _int_or_none(item.get("metascore")),
+            platform_flags(item.get("platforms")),
+            item.get("tiny_image")
+        )
+    
+    @property
+    def price_known(self):
+        return self.price_final is not None
+    
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+class SearchPage:
+    __slots__ = ("total", "items")
+    
+    def __init__(self, total, items):
+        self.total = total
+        self.items = items
+    
+    @classmethod
+    def from_api(cls, data):
+        data = data or {}
+        return cls(data.get("total", 0), [GameRecord.from_search(item) for item in data.get("items", [])])
+    
+    def to_dict(self):
+        return {"total": self.total, "items": [item.to_dict() for item in self.items]}
+    
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["total"], [GameRecord.from_dict(item) for item in data["items"]])
+
+class GameDetails:
+    __slots__ = ("app_id", "name", "short_description", "header_image", "release_date",
+                 "developers", "publishers", "categories", "genres", "screenshots",
+                 "requirements", "price_overview", "platforms", "metascore", "is_free")
+    
+    def __init__(self, app_id, name, short_description="No description available.", header_image="",
+                 release_date="N/A", developers=("N/A",), publishers=("N/A",), categories=(), genres=(),
+                 screenshots=(), requirements=None, price_overview=None, platforms=0, metascore=None,
+                 is_free=False):
+        self.app_id = app_id
+        self.name = name
+        self.short_description = short_description
+        self.header_image = header_image
+        self.release_date = release_date
+        self.developers = tuple(developers)
+        self.publishers = tuple(publishers)
+        self.categories = tuple(categories)
+        self.genres = tuple(genres)
+        self.screenshots = tuple(tuple(screenshot) for screenshot in screenshots)
+        self.requirements = requirements
+        self.price_overview = price_overview
+        self.platforms = platforms
+        self.metascore = metascore
+        self.is_free = is_free
+    
+    @classmethod
+    def from_api(cls, app_id, data):
+        requirements = data.get("pc_requirements")
+        minimum = requirements.get("minimum") if isinstance(requirements, dict) else None
+        return cls(
+            int(app_id),
+            data.get("name", ""),
+            data.get("short_description", "No description available."),
+            data.get("header_image", ""),
+            (data.get("release_date") or {}).get("date", "N/A"),
+            data.get("developers", ["N/A"]),
+            data.get("publishers", ["N/A"]),
+            [cat["description"] for cat in data.get("categories", [])],
+            [genre["description"] for genre in data.get("genres", [])],
+            [
+                (shot.get("path_thumbnail"), shot.get("path_full", shot.get("path_thumbnail")))
+                for shot in data.get("screenshots", [])[:4]
+            ],
+            html_to_text(minimum) if minimum else None,
+            data.get("price_overview"),
+            platform_flags(data.get("platforms")),
+            (data.get("metacritic") or {}).get("score"),
+            bool(data.get("is_free"))
+        )
+    
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
\ No newline at end of file
@@ -0,0 +1,290 @@
+import time
+import webbrowser
+import tkinter as tk
+from collections import OrderedDict
+
+import customtkinter as ctk
+
+from steam_layout import format_price
+from steam_metrics import metrics
+
+class PopupManager:
+    def __init__(self, parent, image_loader=None, pool_size=4, max_age=600):
+        self.parent = parent
+        self.image_loader = image_loader
+        self.pool_size = pool_size
+        self.max_age = max_age
+        
+        self.reused = 0
+        self.built = 0
+        
+        self._open = OrderedDict()
+        self._hidden = OrderedDict()
+    
+    def reveal(self, key):
+        popup = self._open.get(key)
+        if popup is not None:
+            self._open.move_to_end(key)
+            popup.show()
+            return True
+        
+        entry = self._hidden.pop(key, None)
+        if entry is None:
+            return False
+        popup, hidden_at = entry
+        if time.monotonic() - hidden_at > self.max_age:
+            popup.popup.destroy()
+            return False
+        self.reused += 1
+        self._open[key] = popup
+        popup.show()
+        return True
+    
+    def open(self, key, game, details, freshness=""):
+        if self.reveal(key):
+            return self._open[key]
+        self.built += 1
+        popup = GameInfoPopup(self.parent, game, details, self.image_loader, freshness, on_close=self.hide)
+        self._open[key] = popup
+        return popup
+    
+    def hide(self, popup):
+        key = next((key for key, shown in self._open.items() if shown is popup), None)
+        if key is None:
+            popup.popup.destroy()
+            return
+        del self._open[key]
+        popup.hide()
+        self._hidden[key] = (popup, time.monotonic())
+        while len(self._hidden) > self.pool_size:
+            self._hidden.popitem(last=False)[1][0].popup.destroy()
+
+class GameInfoPopup:
+    def __init__(self, parent, game_data, details_data, image_loader=None, freshness="", on_close=None):
+        self.game_data = game_data
+        self.details_data = details_data
+        self.image_loader = image_loader
+        self.on_close = on_close
+        self.popup = ctk.CTkToplevel(parent)
+        self.popup.title(game_data.name)
+        self.popup.geometry("900x700")
+        self.popup.transient(parent)
+        self.popup.protocol("WM_DELETE_WINDOW", self.close)
+        
+        self.colors = {
+            "crimson": "#DC143C",
+            "dark_grey": "#1A1A1A",
+            "light_grey": "#2D2D2D",
+            "text_grey": "#E6E6E6",
+            "accent": "#FF1F4D"
+        }
+        
+        self.popup.configure(fg_color=self.colors["dark_grey"])
+        
+        self.main_container = ctk.CTkScrollableFrame(self.popup)
+        self.main_container.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        self.title_label = ctk.CTkLabel(
+            self.main_container,
+            text=game_data.name,
+            font=("Segoe UI", 28, "bold"),
+            text_color=self.colors["accent"]
+        )
+        self.title_label.pack(pady=(0, 20))
+        
+        if freshness:
+            ctk.CTkLabel(
+                self.main_container,
+                text=f"Showing {freshness}",
+                font=("Segoe UI", 12),
+                text_color=self.colors["text_grey"]
+            ).pack(pady=(0, 10))
+        
+        self.deferred_sections = []
+        self.pending_builders = [
+            self.build_header,
+            self.build_about,
+            self.build_release_price,
+            self.build_development,
+            lambda: self.defer_section(self.build_screenshots),
+            self.build_categories,
+            lambda: self.defer_section(self.build_requirements),
+            self.build_buttons
+        ]
+        
+        canvas = self.main_container._parent_canvas
+        scrollbar_set = canvas.cget("yscrollcommand")
+        canvas.configure(yscrollcommand=lambda first, last: self._on_scroll(scrollbar_set, first, last))
+        
+        self.popup.after_idle(self._build_next)
+    
+    def show(self):
+        self.popup.deiconify()
+        self.popup.lift()
+        self.popup.focus_force()
+    
+    def hide(self):
+        self.popup.withdraw()
+    
+    def close(self):
+        if self.on_close is not None:
+            self.on_close(self)
+        else:
+            self.popup.destroy()
+    
+    def _build_next(self):
+        if not self.popup.winfo_exists() or not self.pending_builders:
+            return
+        builder = self.pending_builders.pop(0)
+        with metrics.span("ui.popup_section", section=builder.__name__):
+            builder()
+        if self.pending_builders:
+            self.popup.after_idle(self._build_next)
+    
+    def defer_section(self, builder):
+        placeholder = ctk.CTkFrame(self.main_container, height=160, fg_color="transparent")
+        placeholder.pack(fill="x")
+        self.deferred_sections.append((placeholder, builder))
+    
+    def _on_scroll(self, scrollbar_set, first, last):
+        self.popup.tk.call(scrollbar_set, first, last)
+        if not self.deferred_sections:
+            return
+        
+        visible_bottom = float(last) * self.main_container.winfo_height() + 100
+        for placeholder, builder in list(self.deferred_sections):
+            if placeholder.winfo_y() <= visible_bottom:
+                self.deferred_sections.remove((placeholder, builder))
+                placeholder.configure(height=1)
+                builder(placeholder)
+    
+    def build_header(self):
+        header_url = self.details_data.header_image
+        if header_url:
+            html_frame = tk.Frame(self.main_container, bg=self.colors["dark_grey"])
+            html_frame.pack(fill="x", pady=(0, 20))
+            
+            webview = ctk.CTkLabel(
+                html_frame,
+                text="[Game Image]",
+                text_color=self.colors["text_grey"]
+            )
+            webview.pack(pady=10)
+            self.show_image(webview, header_url, (460, 215))
+            
+            view_image_btn = ctk.CTkButton(
+                html_frame,
+                text="View Full Size Image",
+                command=lambda: webbrowser.open(header_url),
+                fg_color=self.colors["accent"],
+                hover_color="#FF0F3D"
+            )
+            view_image_btn.pack(pady=(0, 10))
+    
+    def build_about(self):
+        self.create_info_section("About", self.details_data.short_description)
+    
+    def build_release_price(self):
+        overview = self.details_data.price_overview or {}
+        price_text = format_price(overview.get("final", self.game_data.price_final),
+                                  overview.get("currency", self.game_data.currency))
+        release_date = self.details_data.release_date
+        self.create_info_section("Release & Price", f"Price: {price_text}\nRelease Date: {release_date}")
+    
+    def build_development(self):
+        dev_pub_info = (
+            f"Developers: {', '.join(self.details_data.developers)}\n"
+            f"Publishers: {', '.join(self.details_data.publishers)}"
+        )
+        self.create_info_section("Development", dev_pub_info)
+    
+    def build_screenshots(self, parent):
+        screenshots = self.details_data.screenshots
+        if screenshots:
+            self.create_section_title("Screenshots", parent)
+            screenshots_frame = ctk.CTkFrame(parent)
+            screenshots_frame.pack(fill="x", pady=(0, 20))
+            
+            for i, (thumbnail_url, full_url) in enumerate(screenshots):
+                screenshot_label = ctk.CTkLabel(
+                    screenshots_frame,
+                    text=f"[Screenshot {i+1}]",
+                    text_color=self.colors["text_grey"]
+                )
+                screenshot_label.pack(pady=5)
+                self.show_image(screenshot_label, thumbnail_url, (320, 180))
+                
+                view_btn = ctk.CTkButton(
+                    screenshots_frame,
+                    text=f"View Screenshot {i+1}",
+                    command=lambda url=full_url: webbrowser.open(url),
+                    fg_color=self.colors["accent"],
+                    hover_color="#FF0F3D"
+                )
+                view_btn.pack(pady=(0, 10))
+    
+    def build_categories(self):
+        categories = ", ".join(self.details_data.categories)
+        genres = ", ".join(self.details_data.genres)
+        self.create_info_section("Categories & Genres", f"Categories:\n{categories}\n\nGenres:\n{genres}")
+    
+    def build_requirements(self, parent):
+        requirements = self.details_data.requirements
+        if requirements:
+            self.create_info_section("System Requirements", requirements, parent)
+    
+    def build_buttons(self):
+        buttons_frame = ctk.CTkFrame(self.main_container)
+        buttons_frame.pack(fill="x", pady=(20, 0))
+        
+        store_btn = ctk.CTkButton(
+            buttons_frame,
+            text="View on Steam",
+            command=lambda: webbrowser.open(f"https://store.steampowered.com/app/{self.game_data.id}"),
+            fg_color=self.colors["accent"],
+            hover_color="#FF0F3D"
+        )
+        store_btn.pack(side="left", padx=5)
+        
+        close_btn = ctk.CTkButton(
+            buttons_frame,
+            text="Close",
+            command=self.close,
+            fg_color=self.colors["light_grey"],
+            hover_color="#303030"
+        )
+        close_btn.pack(side="right", padx=5)
+    
+    def show_image(self, label, url, size):
+        if self.image_loader is not None:
+            self.image_loader.load(url, size, lambda image: self._set_image(label, image))
+    
+    def _set_image(self, label, image):
+        if not label.winfo_exists():
+            return
+        label.configure(
+            image=ctk.CTkImage(light_image=image, dark_image=image, size=image.size),
+            text=""
+        )
+    
+    def create_section_title(self, title, parent=None):
+        title_label = ctk.CTkLabel(
+            parent or self.main_container,
+            text=title,
+            font=("Segoe UI", 18, "bold"),
+            text_color=self.colors["accent"]
+        )
+        title_label.pack(pady=(20, 5), anchor="w")
+    
+    def create_info_section(self, title, content, parent=None):
+        self.create_section_title(title, parent)
+        
+        content_box = ctk.CTkTextbox(
+            parent or self.main_container,
+            height=100,
+            wrap="word",
+            font=("Segoe UI", 12)
+        )
+        content_box.pack(fill="x", pady=(0, 10))
+        content_box.insert("1.0", content)
+        content_box.configure(state="disabled")
\ No newline at end of file
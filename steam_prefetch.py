@@ -0,0 +1,99 @@
+import heapq
+import itertools
+import threading
+
+from steam_cache import background_pool
+
+PRICE_BATCH_SIZE = 100
+PREFETCH_RESERVE = 0.5
+
+class DetailsPrefetcher:
+    def __init__(self, service, workers=2, max_prefetch=10, reserve=PREFETCH_RESERVE, executor=background_pool):
+        self.service = service
+        self.workers = workers
+        self.max_prefetch = max_prefetch
+        self.reserve = reserve
+        self._executor = executor
+        
+        self.prefetched = 0
+        self.skipped = 0
+        
+        self._queue = []
+        self._queued = set()
+        self._counter = itertools.count()
+        self._generation = 0
+        self._region = ("US", "english")
+        self._active = 0
+        self._lock = threading.Lock()
+        self._stopped = False
+    
+    def prefetch_page(self, app_ids, cc="US", l="english"):
+        with self._lock:
+            self._generation += 1
+            self._region = (cc, l)
+            self._queue.clear()
+            self._queued.clear()
+            
+            missing = self.service.cached_prices(app_ids, cc)[1]
+            for start in range(0, len(missing), PRICE_BATCH_SIZE):
+                self._push(-2, ("prices", tuple(missing[start:start + PRICE_BATCH_SIZE])))
+            
+            for index, app_id in enumerate(app_ids[:self.max_prefetch]):
+                self._push(index, ("details", app_id))
+            
+            self._start()
+    
+    def prioritize(self, app_id):
+        with self._lock:
+            self._queued.discard(("details", app_id))
+            self._push(-1, ("details", app_id))
+            self._start()
+    
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+            self._queue.clear()
+    
+    def _push(self, priority, task):
+        if task in self._queued:
+            return
+        self._queued.add(task)
+        heapq.heappush(self._queue, (priority, next(self._counter), self._generation, task))
+    
+    def _start(self):
+        while not self._stopped and self._active < min(self.workers, len(self._queue)):
+            self._active += 1
+            self._executor.submit(self._work)
+    
+    def _work(self):
+        while True:
+            with self._lock:
+                if self._stopped or not self._queue:
+                    self._active -= 1
+                    return
+                _, _, generation, task = heapq.heappop(self._queue)
+                if generation != self._generation or task not in self._queued:
+                    continue
+                self._queued.discard(task)
+                cc, l = self._region
+            
+            if self.service.client.headroom("appdetails") < self.reserve:
+                self.skipped += 1
+                continue
+            
+            try:
+                if task[0] == "prices":
+                    self._fetch_prices(task[1], cc, l)
+                else:
+                    self._fetch_details(task[1], cc, l)
+            except Exception:
+                pass
+    
+    def _fetch_prices(self, app_ids, cc, l):
+        self.service.fetch_prices(list(app_ids), cc, l)
+    
+    def _fetch_details(self, app_id, cc, l):
+        if self.service.details_fresh(app_id, cc, l):
+            return
+        self.service.app_details(app_id, cc, l)
+        self.prefetched += 1
\ No newline at end of file
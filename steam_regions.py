@@ -0,0 +1,58 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from steam_api import RateLimitError, SteamApiError, SteamUnavailableError
+from steam_metrics import metrics
+from steam_prefetch import PRICE_BATCH_SIZE
+
+DEFAULT_REGIONS = "US,CA,BR,AR,GB,DE,PL,TR,UA,KZ,IN,CN,JP,KR,AU"
+REGIONS = tuple(cc.strip().upper() for cc in os.environ.get("CRYMSON_REGIONS", DEFAULT_REGIONS).split(",") if cc.strip())
+
+class RegionPrices:
+    def __init__(self, service, regions=REGIONS, batch_size=PRICE_BATCH_SIZE, workers=6):
+        self.service = service
+        self.regions = tuple(regions)
+        self.batch_size = batch_size
+        self.workers = workers
+        
+        self.batches = 0
+        self.cached = 0
+        self.failed = 0
+    
+    def fetch(self, app_ids, regions=None):
+        regions = tuple(regions or self.regions)
+        prices = {app_id: {} for app_id in app_ids}
+        
+        tasks = []
+        for cc in regions:
+            known, missing = self.service.cached_prices(app_ids, cc)
+            self.cached += len(known)
+            for app_id, price in known.items():
+                prices[app_id][cc] = price
+            tasks.extend((cc, missing[start:start + self.batch_size])
+                         for start in range(0, len(missing), self.batch_size))
+        
+        if not tasks:
+            return prices
+        
+        with metrics.span("regions.fetch", apps=len(app_ids), regions=len(regions), batches=len(tasks)):
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(tasks))) as executor:
+                futures = {executor.submit(self.service.fetch_prices, batch, cc): (cc, batch) for cc, batch in tasks}
+                for future in as_completed(futures):
+                    cc, batch = futures[future]
+                    try:
+                        result = future.result()
+                    except (SteamUnavailableError, RateLimitError):
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                    except SteamApiError:
+                        self.failed += len(batch)
+                        continue
+                    self.batches += 1
+                    for app_id, price in result.items():
+                        prices[app_id][cc] = price
+        
+        if not any(prices[app_id] for app_id in app_ids) and self.service.offline:
+            raise SteamUnavailableError("Steam is unreachable and no regional prices are cached")
+        return prices
\ No newline at end of file
@@ -0,0 +1,276 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+from steam_models import PLATFORM_LINUX, PLATFORM_MAC, PLATFORM_WINDOWS
+
+UNKNOWN = -1
+PLATFORMS = {"Windows": PLATFORM_WINDOWS, "Mac": PLATFORM_MAC, "Linux": PLATFORM_LINUX}
+SORT_KEYS = ("price", "metascore", "year", "name")
+MAX_GENRES = 64
+
+_YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+
+popcount = getattr(int, "bit_count", None) or (lambda mask: bin(mask).count("1"))
+
+def release_year(date):
+    match = _YEAR.search(date or "")
+    return int(match.group()) if match else UNKNOWN
+
+class ResultFilter:
+    __slots__ = ("price_min", "price_max", "free", "genres", "platforms",
+                 "year_min", "year_max", "metascore_min", "sort", "descending")
+    
+    def __init__(self, price_min=None, price_max=None, free=None, genres=(), platforms=0,
+                 year_min=None, year_max=None, metascore_min=None, sort=None, descending=False):
+        self.price_min = price_min
+        self.price_max = price_max
+        self.free = free
+        self.genres = tuple(genres)
+        self.platforms = platforms
+        self.year_min = year_min
+        self.year_max = year_max
+        self.metascore_min = metascore_min
+        self.sort = sort
+        self.descending = descending
+    
+    @property
+    def active(self):
+        return (self.sort is not None or bool(self.genres or self.platforms) or self.free is not None
+                or any(value is not None for value in (self.price_min, self.price_max, self.year_min,
+                                                       self.year_max, self.metascore_min)))
+
+class ResultView:
+    def __init__(self, results, mask, order):
+        self.results = results
+        self.mask = mask
+        self.order = order
+        self._count = popcount(mask)
+        self._bits = mask.to_bytes((len(results) + 7) // 8 or 1, "little")
+        self._rows = []
+        self._cursor = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        rows, order, bits = self._rows, self.order, self._bits
+        cursor = self._cursor
+        while len(rows) <= index:
+            row = order[cursor]
+            cursor += 1
+            if bits[row >> 3] >> (row & 7) & 1:
+                rows.append(row)
+        self._cursor = cursor
+        return self.results.records[rows[index]]
+
+class ResultSet:
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        self.records = []
+        self.rows = {}
+        self.price = array("q")
+        self.metascore = array("h")
+        self.year = array("h")
+        self.platforms = array("B")
+        self.genres = array("Q")
+        self.enriched = bytearray()
+        self.genre_names = []
+        
+        self._genre_bits = {}
+        self._all = 0
+        self._values = {"price": {}, "metascore": {}, "year": {}}
+        self._value_keys = {}
+        self._flags = {"platform": {}, "genre": {}}
+        self._orders = {}
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def add(self, records):
+        count = len(self.records)
+        for record in records:
+            row = self.rows.get(record.id)
+            if row is None:
+                row = len(self.records)
+                self.rows[record.id] = row
+                self.records.append(record)
+                self.price.append(UNKNOWN)
+                self.metascore.append(UNKNOWN)
+                self.year.append(UNKNOWN)
+                self.platforms.append(0)
+                self.genres.append(0)
+                self.enriched.append(0)
+            else:
+                self.records[row] = record
+                self._orders.pop(("name", False), None)
+                self._orders.pop(("name", True), None)
+            
+            if record.price_known or self.price[row] == UNKNOWN:
+                self._set_value("price", row, UNKNOWN if record.price_final is None else record.price_final)
+            if record.metascore is not None:
+                self._set_value("metascore", row, record.metascore)
+            if record.platforms:
+                self._set_flags("platform", self.platforms, row, record.platforms)
+        
+        if len(self.records) != count:
+            self._all = (1 << len(self.records)) - 1
+            self._orders.clear()
+    
+    def enrich(self, details):
+        row = self.rows.get(details.app_id)
+        if row is not None:
+            self._apply_details(row, details)
+        return row is not None
+    
+    def pending(self, limit):
+        app_ids = []
+        row = self.enriched.find(0)
+        while row != -1 and len(app_ids) < limit:
+            app_ids.append(self.records[row].id)
+            row = self.enriched.find(0, row + 1)
+        return app_ids
+    
+    def mark_missing(self, app_id):
+        row = self.rows.get(app_id)
+        if row is not None and not self.enriched[row]:
+            self.enriched[row] = 2
+    
+    def _apply_details(self, row, details):
+        self.enriched[row] = 1
+        bits = 0
+        for name in details.genres:
+            bit = self._genre_bits.get(name)
+            if bit is None and len(self.genre_names) < MAX_GENRES:
+                bit = self._genre_bits[name] = 1 << len(self.genre_names)
+                self.genre_names.append(name)
+            bits |= bit or 0
+        self._set_flags("genre", self.genres, row, bits)
+        self._set_value("year", row, release_year(details.release_date))
+        if details.metascore is not None:
+            self._set_value("metascore", row, details.metascore)
+        if details.platforms:
+            self._set_flags("platform", self.platforms, row, details.platforms)
+        if self.price[row] == UNKNOWN and details.price_overview:
+            self._set_value("price", row, details.price_overview.get("final", UNKNOWN))
+        elif self.price[row] == UNKNOWN and details.is_free:
+            self._set_value("price", row, 0)
+    
+    def _set_value(self, column, row, value):
+        values = getattr(self, column)
+        old = values[row]
+        if old == value:
+            return
+        bitmaps = self._values[column]
+        bit = 1 << row
+        if old != UNKNOWN:
+            bitmaps[old] &= ~bit
+            if not bitmaps[old]:
+                del bitmaps[old]
+                self._value_keys.pop(column, None)
+        if value != UNKNOWN:
+            if value not in bitmaps:
+                bitmaps[value] = 0
+                self._value_keys.pop(column, None)
+            bitmaps[value] |= bit
+        values[row] = value
+        self._orders.pop((column, False), None)
+        self._orders.pop((column, True), None)
+    
+    def _set_flags(self, kind, column, row, flags):
+        old = column[row]
+        if old == flags:
+            return
+        bitmaps = self._flags[kind]
+        bit = 1 << row
+        for flag in self._split(old & ~flags):
+            bitmaps[flag] &= ~bit
+        for flag in self._split(flags & ~old):
+            bitmaps[flag] = bitmaps.get(flag, 0) | bit
+        column[row] = flags
+    
+    @staticmethod
+    def _split(flags):
+        while flags:
+            flag = flags & -flags
+            yield flag
+            flags ^= flag
+    
+    def _range(self, column, low, high):
+        bitmaps = self._values[column]
+        keys = self._value_keys.get(column)
+        if keys is None:
+            keys = self._value_keys[column] = sorted(bitmaps)
+        start = 0 if low is None else bisect_left(keys, low)
+        end = len(keys) if high is None else bisect_right(keys, high)
+        mask = 0
+        for key in keys[start:end]:
+            mask |= bitmaps[key]
+        return mask
+    
+    def mask(self, result_filter):
+        mask = self._all
+        if result_filter.free is True:
+            mask &= self._values["price"].get(0, 0)
+        elif result_filter.free is False:
+            mask &= self._range("price", 1, None)
+        if result_filter.price_min is not None or result_filter.price_max is not None:
+            mask &= self._range("price", result_filter.price_min, result_filter.price_max)
+        if result_filter.year_min is not None or result_filter.year_max is not None:
+            mask &= self._range("year", result_filter.year_min, result_filter.year_max)
+        if result_filter.metascore_min is not None:
+            mask &= self._range("metascore", result_filter.metascore_min, None)
+        for flag in self._split(result_filter.platforms):
+            mask &= self._flags["platform"].get(flag, 0)
+        for name in result_filter.genres:
+            mask &= self._flags["genre"].get(self._genre_bits.get(name), 0)
+        return mask
+    
+    def query(self, result_filter):
+        return ResultView(self, self.mask(result_filter), self.order(result_filter.sort, result_filter.descending))
+    
+    def order(self, key=None, descending=False):
+        if key is None:
+            return range(len(self.records))
+        order = self._orders.get((key, descending))
+        if order is None:
+            order = self._orders[(key, descending)] = self._sorted(key, descending)
+        return order
+    
+    def _sorted(self, key, descending):
+        if key == "name":
+            names = [record.name.casefold() for record in self.records]
+            return array("I", sorted(range(len(names)), key=names.__getitem__, reverse=descending))
+        values = getattr(self, key)
+        known = sorted((row for row in range(len(values)) if values[row] != UNKNOWN),
+                       key=values.__getitem__, reverse=descending)
+        return array("I", known + [row for row in range(len(values)) if values[row] == UNKNOWN])
+    
+    def facets(self, mask=None):
+        mask = self._all if mask is None else mask
+        genres = self._flags["genre"]
+        return {
+            "total": popcount(mask),
+            "free": popcount(mask & self._values["price"].get(0, 0)),
+            "paid": popcount(mask & self._range("price", 1, None)),
+            "platforms": {
+                name: popcount(mask & self._flags["platform"].get(flag, 0)) for name, flag in PLATFORMS.items()
+            },
+            "genres": self._counts(mask, ((name, genres.get(self._genre_bits[name], 0)) for name in self.genre_names)),
+            "years": self._counts(mask, sorted(self._values["year"].items(), reverse=True))
+        }
+    
+    @staticmethod
+    def _counts(mask, bitmaps):
+        counts = {}
+        for key, bitmap in bitmaps:
+            count = popcount(mask & bitmap)
+            if count:
+                counts[key] = count
+        return counts
\ No newline at end of file
@@ -0,0 +1,127 @@
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+PUMP_INTERVAL_MS = 16
+FRAME_BUDGET = 0.008
+
+class RequestScheduler:
+    def __init__(self, app, max_workers=4, on_busy=None):
+        self.app = app
+        self.on_busy = on_busy
+        self.in_flight = 0
+        self.dispatched = 0
+        self.coalesced = 0
+        
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crymson")
+        self._lock = threading.Lock()
+        self._channels = {}
+        self._pending = set()
+        self._generation = 0
+        self._calls = deque()
+        self._latest = {}
+        self._pump_job = self.app.after(PUMP_INTERVAL_MS, self.pump)
+    
+    def submit(self, fn, *args, on_done=None, on_error=None, channel=None, track=True):
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            
+            if channel is not None:
+                previous = self._channels.get(channel)
+                if previous is not None:
+                    previous[1].cancel()
+            
+            if track:
+                self.in_flight += 1
+            future = self._executor.submit(fn, *args)
+            self._pending.add(future)
+            if channel is not None:
+                self._channels[channel] = (generation, future)
+        
+        if track:
+            self._notify_busy()
+        future.add_done_callback(
+            lambda f: self.call_soon(self._deliver, f, channel, generation, on_done, on_error, track)
+        )
+        return future
+    
+    def cancel(self, channel):
+        with self._lock:
+            current = self._channels.pop(channel, None)
+        if current is not None:
+            current[1].cancel()
+    
+    def call_soon(self, fn, *args):
+        self._calls.append((fn, args))
+    
+    def call_latest(self, key, fn, *args):
+        with self._lock:
+            pending = key in self._latest
+            self._latest[key] = (fn, args)
+            if pending:
+                self.coalesced += 1
+        if not pending:
+            self._calls.append((self._run_latest, (key,)))
+    
+    def _run_latest(self, key):
+        with self._lock:
+            fn, args = self._latest.pop(key)
+        fn(*args)
+    
+    def pump(self):
+        self._pump_job = self.app.after(PUMP_INTERVAL_MS, self.pump)
+        deadline = time.perf_counter() + FRAME_BUDGET
+        for _ in range(len(self._calls)):
+            fn, args = self._calls.popleft()
+            self.dispatched += 1
+            try:
+                fn(*args)
+            except Exception:
+                self.app.report_callback_exception(*sys.exc_info())
+            if time.perf_counter() > deadline:
+                break
+    
+    def shutdown(self):
+        if self._pump_job is not None:
+            self.app.after_cancel(self._pump_job)
+            self._pump_job = None
+        with self._lock:
+            pending, self._pending = self._pending, set()
+        for future in pending:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+    
+    def _deliver(self, future, channel, generation, on_done, on_error, track):
+        with self._lock:
+            self._pending.discard(future)
+            if track:
+                self.in_flight -= 1
+            superseded = False
+            if channel is not None:
+                current = self._channels.get(channel)
+                superseded = current is None or current[0] != generation
+                if not superseded:
+                    del self._channels[channel]
+        
+        if track:
+            self._notify_busy()
+        
+        if superseded or future.cancelled():
+            return
+        
+        error = future.exception()
+        if error is not None:
+            if on_error:
+                on_error(error)
+        elif on_done:
+            on_done(future.result())
+    
+    def _notify_busy(self):
+        if self.on_busy:
+            self.call_latest("busy", self._report_busy)
+    
+    def _report_busy(self):
+        self.on_busy(self.in_flight)
\ No newline at end of file
@@ -0,0 +1,54 @@
+import threading
+import time
+
+from steam_api import RateLimitError, SteamUnavailableError
+
+class BackgroundSync:
+    def __init__(self, service, interval=300, details_per_cycle=20, pages_per_cycle=5, pause=2.0):
+        self.service = service
+        self.interval = interval
+        self.details_per_cycle = details_per_cycle
+        self.pages_per_cycle = pages_per_cycle
+        self.pause = pause
+        
+        self.refreshed = 0
+        self.last_sync = None
+        
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="crymson-sync", daemon=True)
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+    
+    def sync_once(self):
+        cache = self.service.details_cache
+        for key in cache.stale_keys(self.details_per_cycle):
+            app_id, cc, l = cache.parse_key(key)
+            if not self._refresh(self.service.refresh_details, app_id, cc, l):
+                return
+        
+        cache = self.service.search_cache
+        for key in cache.stale_keys(self.pages_per_cycle):
+            query, page, count, cc, l = cache.parse_key(key)
+            if not self._refresh(self.service.refresh_search, query, page, count, cc, l):
+                return
+    
+    def _refresh(self, refresh, *args):
+        if self._stop.wait(self.pause):
+            return False
+        try:
+            refresh(*args)
+        except (SteamUnavailableError, RateLimitError):
+            return False
+        except Exception:
+            return True
+        self.refreshed += 1
+        return True
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sync_once()
+            self.last_sync = time.time()
\ No newline at end of file
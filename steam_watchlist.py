@@ -0,0 +1,216 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from steam_api import RateLimitError, SteamUnavailableError
+from steam_cache import CACHE_DIR
+from steam_metrics import metrics
+from steam_prefetch import PRICE_BATCH_SIZE
+
+WATCHLIST_PATH = os.path.join(CACHE_DIR, "watchlist.sqlite3")
+
+def price_hash(price):
+    if not price:
+        return "none"
+    fields = (price.get("currency"), price.get("initial"), price.get("final"), price.get("discount_percent"))
+    return hashlib.blake2b(repr(fields).encode("utf-8"), digest_size=8).hexdigest()
+
+class Watchlist:
+    def __init__(self, path=WATCHLIST_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        self._setup()
+    
+    def _setup(self):
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS watchlist ("
+            "appid INTEGER PRIMARY KEY, name TEXT NOT NULL, added_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS prices ("
+            "appid INTEGER NOT NULL, cc TEXT NOT NULL, hash TEXT NOT NULL, "
+            "final INTEGER, initial INTEGER, discount INTEGER, currency TEXT, previous_final INTEGER, "
+            "changed_at REAL NOT NULL, checked_at REAL NOT NULL, PRIMARY KEY (appid, cc))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS prices_checked ON prices (cc, checked_at)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS price_history ("
+            "appid INTEGER NOT NULL, cc TEXT NOT NULL, recorded_at REAL NOT NULL, "
+            "final INTEGER, initial INTEGER, discount INTEGER)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS price_history_app ON price_history (appid, cc, recorded_at)")
+        self._db.commit()
+    
+    def count(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM watchlist").fetchone()[0]
+    
+    def contains(self, app_id):
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM watchlist WHERE appid = ?", (app_id,)).fetchone() is not None
+    
+    def add(self, apps):
+        now = time.time()
+        with self._lock:
+            added = self._db.executemany(
+                "INSERT OR IGNORE INTO watchlist (appid, name, added_at) VALUES (?, ?, ?)",
+                ((app_id, name or "", now) for app_id, name in apps)
+            ).rowcount
+            self._db.commit()
+            return added
+    
+    def remove(self, app_ids):
+        app_ids = [(app_id,) for app_id in app_ids]
+        with self._lock:
+            removed = self._db.executemany("DELETE FROM watchlist WHERE appid = ?", app_ids).rowcount
+            self._db.executemany("DELETE FROM prices WHERE appid = ?", app_ids)
+            self._db.executemany("DELETE FROM price_history WHERE appid = ?", app_ids)
+            self._db.commit()
+            return removed
+    
+    def due(self, cc, max_age=0, limit=-1):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT watchlist.appid FROM watchlist "
+                "LEFT JOIN prices ON prices.appid = watchlist.appid AND prices.cc = ? "
+                "WHERE prices.checked_at IS NULL OR prices.checked_at <= ? "
+                "ORDER BY prices.checked_at IS NOT NULL, prices.checked_at LIMIT ?",
+                (cc, time.time() - max_age, limit)
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def hashes(self, app_ids, cc):
+        hashes = {}
+        with self._lock:
+            for start in range(0, len(app_ids), 500):
+                chunk = app_ids[start:start + 500]
+                rows = self._db.execute(
+                    f"SELECT appid, hash, final FROM prices WHERE cc = ? AND appid IN ({','.join('?' * len(chunk))})",
+                    (cc, *chunk)
+                ).fetchall()
+                hashes.update((app_id, (digest, final)) for app_id, digest, final in rows)
+        return hashes
+    
+    def record(self, cc, checked, changed):
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "UPDATE prices SET checked_at = ? WHERE appid = ? AND cc = ?",
+                ((now, app_id, cc) for app_id in checked)
+            )
+            self._db.executemany(
+                "INSERT INTO prices (appid, cc, hash, final, initial, discount, currency, previous_final, "
+                "changed_at, checked_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (appid, cc) DO UPDATE SET hash = excluded.hash, final = excluded.final, "
+                "initial = excluded.initial, discount = excluded.discount, currency = excluded.currency, "
+                "previous_final = prices.final, changed_at = excluded.changed_at, checked_at = excluded.checked_at",
+                ((app_id, cc, digest, *self._columns(price), None, now, now) for app_id, digest, price in changed)
+            )
+            self._db.executemany(
+                "INSERT INTO price_history (appid, cc, recorded_at, final, initial, discount) VALUES (?, ?, ?, ?, ?, ?)",
+                ((app_id, cc, now, *self._columns(price)[:3]) for app_id, _, price in changed)
+            )
+            self._db.commit()
+    
+    @staticmethod
+    def _columns(price):
+        price = price or {}
+        return price.get("final"), price.get("initial"), price.get("discount_percent"), price.get("currency")
+    
+    def items(self, cc):
+        with self._lock:
+            return self._db.execute(
+                "SELECT watchlist.appid, watchlist.name, prices.final, prices.initial, prices.currency, "
+                "prices.previous_final, prices.checked_at FROM watchlist "
+                "LEFT JOIN prices ON prices.appid = watchlist.appid AND prices.cc = ? "
+                "ORDER BY watchlist.name COLLATE NOCASE",
+                (cc,)
+            ).fetchall()
+    
+    def drops(self, cc, since=0):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT appid, previous_final, final FROM prices "
+                "WHERE cc = ? AND changed_at >= ? AND final < previous_final",
+                (cc, since)
+            ).fetchall()
+        return {app_id: (previous, final) for app_id, previous, final in rows}
+    
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+class PriceTracker:
+    def __init__(self, client, watchlist, batch_size=PRICE_BATCH_SIZE, workers=4):
+        self.client = client
+        self.watchlist = watchlist
+        self.batch_size = batch_size
+        self.workers = workers
+        
+        self.checked = 0
+        self.changed = 0
+        self._stopped = threading.Event()
+    
+    def stop(self):
+        self._stopped.set()
+    
+    def refresh(self, cc="US", l="english", max_age=0, on_progress=None):
+        app_ids = self.watchlist.due(cc, max_age)
+        batches = [app_ids[start:start + self.batch_size] for start in range(0, len(app_ids), self.batch_size)]
+        summary = {"due": len(app_ids), "checked": 0, "changed": 0, "drops": {}}
+        
+        with metrics.span("watchlist.refresh", apps=len(app_ids)):
+            executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="crymson-watchlist")
+            futures = {
+                executor.submit(self.client.app_details_batch, batch, cc, l, "price_overview"): batch
+                for batch in batches
+            }
+            try:
+                for future in as_completed(futures):
+                    if self._stopped.is_set():
+                        break
+                    try:
+                        prices = future.result()
+                    except (SteamUnavailableError, RateLimitError):
+                        break
+                    except Exception:
+                        continue
+                    self._apply(futures[future], prices, cc, summary)
+                    if on_progress:
+                        on_progress(summary["checked"], len(app_ids))
+            finally:
+                for pending in futures:
+                    pending.cancel()
+                executor.shutdown(wait=False)
+        
+        summary["failed"] = len(app_ids) - summary["checked"]
+        return summary
+    
+    def _apply(self, batch, prices, cc, summary):
+        known = self.watchlist.hashes(batch, cc)
+        unchanged, changed = [], []
+        for app_id in batch:
+            price = prices.get(app_id, {}).get("price_overview")
+            digest = price_hash(price)
+            previous = known.get(app_id)
+            if previous is not None and previous[0] == digest:
+                unchanged.append(app_id)
+                continue
+            changed.append((app_id, digest, price))
+            if previous is not None and price and previous[1] is not None and price.get("final", 0) < previous[1]:
+                summary["drops"][app_id] = (previous[1], price["final"])
+        self.watchlist.record(cc, unchanged, changed)
+        
+        summary["checked"] += len(batch)
+        summary["changed"] += len(changed)
+        self.checked += len(batch)
+        self.changed += len(changed)
\ No newline at end of file
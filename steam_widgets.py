@@ -0,0 +1,105 @@
+import math
+
+import customtkinter as ctk
+
+class VirtualList(ctk.CTkFrame):
+    def __init__(self, master, create_row, bind_row, row_height=40, **kwargs):
+        super().__init__(master, **kwargs)
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+        
+        self.items = []
+        self.offset = 0
+        self.rows = []
+        
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True)
+        
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.body.bind("<Configure>", self._on_configure)
+        self.bind_all("<MouseWheel>", self._on_wheel, add="+")
+        self.bind_all("<Button-4>", self._on_wheel, add="+")
+        self.bind_all("<Button-5>", self._on_wheel, add="+")
+    
+    def set_items(self, items):
+        self.items = items
+        self.offset = 0
+        self.refresh()
+    
+    def refresh(self, rebind=False):
+        if not self.rows:
+            self._resize_pool(self.body.winfo_height())
+        
+        first = self.offset // self.row_height
+        shift = self.offset % self.row_height
+        
+        for i, row in enumerate(self.rows):
+            index = first + i
+            if index < len(self.items):
+                if rebind or row.item_index != index or row.item is not self.items[index]:
+                    row.item_index = index
+                    row.item = self.items[index]
+                    self.bind_row(row, self.items[index])
+                row.place(x=0, y=i * self.row_height - shift, relwidth=1.0, height=self.row_height)
+            else:
+                row.item_index = None
+                row.item = None
+                row.place_forget()
+        
+        self._update_scrollbar()
+    
+    def scroll_to(self, offset):
+        self.offset = int(max(0, min(offset, self._max_offset())))
+        self.refresh()
+    
+    def scroll_by(self, pixels):
+        self.scroll_to(self.offset + pixels)
+    
+    def _resize_pool(self, height):
+        needed = max(1, math.ceil(max(height, self.row_height) / self.row_height) + 1)
+        while len(self.rows) < needed:
+            row = self.create_row(self.body)
+            row.item = None
+            row.item_index = None
+            self.rows.append(row)
+        while len(self.rows) > needed:
+            self.rows.pop().destroy()
+    
+    def _on_configure(self, event):
+        self._resize_pool(event.height)
+        self.offset = min(self.offset, self._max_offset())
+        self.refresh()
+    
+    def _max_offset(self):
+        viewport = max(self.body.winfo_height(), self.row_height)
+        return max(0, len(self.items) * self.row_height - viewport)
+    
+    def _update_scrollbar(self):
+        total = len(self.items) * self.row_height
+        if total <= 0:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        viewport = max(self.body.winfo_height(), self.row_height)
+        self.scrollbar.set(self.offset / total, min(1.0, (self.offset + viewport) / total))
+    
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(value) * len(self.items) * self.row_height)
+        elif action == "scroll":
+            step = self.body.winfo_height() if unit == "pages" else self.row_height
+            self.scroll_by(int(value) * step)
+    
+    def _on_wheel(self, event):
+        path = str(event.widget)
+        if path != str(self) and not path.startswith(str(self) + "."):
+            return
+        if event.num == 4:
+            self.scroll_by(-self.row_height)
+        elif event.num == 5:
+            self.scroll_by(self.row_height)
+        elif event.delta:
+            steps = event.delta / 120 if abs(event.delta) >= 120 else event.delta
+            self.scroll_by(int(-steps * self.row_height))
\ No newline at end of file